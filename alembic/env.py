@@ -3,7 +3,7 @@
 from logging.config import fileConfig
 
 from cli2ansible.adapters.outbound.db.orm import Base
-from cli2ansible.settings import settings
+from cli2ansible.settings import get_settings
 from sqlalchemy import engine_from_config, pool
 
 from alembic import context
@@ -22,7 +22,7 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 # Override sqlalchemy.url from settings
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 
 def run_migrations_offline() -> None:
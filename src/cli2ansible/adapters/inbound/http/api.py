@@ -1,11 +1,17 @@
 """FastAPI HTTP adapter."""
 
-from typing import Any
+import hashlib
+from typing import Annotated, Any
 from uuid import UUID
 
+from cli2ansible.domain.models import Event
 from cli2ansible.domain.services import CleanSession, CompilePlaybook, IngestSession
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from cli2ansible.settings import get_settings
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from .schemas import (
     ArtifactResponse,
@@ -19,6 +25,38 @@ from .schemas import (
     SessionResponse,
 )
 
+# Built once so event uploads validate straight from the raw JSON bytes
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventCreate])
+_EVENT_LIST_SCHEMA = {"type": "array", "items": EventCreate.model_json_schema()}
+
+# Health check payload is constant, so encode it once
+_HEALTH_BODY = b'{"status":"ok","service":"cli2ansible"}'
+
+
+def _etag(*parts: object) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    digest = hashlib.blake2b(
+        ":".join(str(part) for part in parts).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (RFC 9110 weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def get_clean_service(request: Request) -> CleanSession | None:
+    """Provide the app's clean service; override to toggle it (e.g. in tests)."""
+    service: CleanSession | None = request.app.state.clean_service
+    return service
+
 
 def create_app(
     ingest_service: IngestSession,
@@ -26,12 +64,17 @@ def create_app(
     clean_service: CleanSession | None = None,
 ) -> FastAPI:
     """Create FastAPI application."""
-    app = FastAPI(title="cli2ansible", version="0.1.0")
+    app = FastAPI(
+        title="cli2ansible",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
+    app.state.clean_service = clean_service
 
-    @app.get("/")
-    async def root() -> dict[str, str]:
+    @app.get("/", response_model=dict[str, str])
+    async def root() -> Response:
         """Health check endpoint."""
-        return {"status": "ok", "service": "cli2ansible"}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     @app.post("/sessions", response_model=SessionResponse)
     async def create_session(session: SessionCreate) -> Any:
@@ -63,12 +106,44 @@ def create_app(
             metadata=session.metadata,
         )
 
-    @app.post("/sessions/{session_id}/events")
-    async def upload_events(
-        session_id: UUID, events: list[EventCreate]
-    ) -> dict[str, str]:
+    @app.post(
+        "/sessions/{session_id}/events",
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {"application/json": {"schema": _EVENT_LIST_SCHEMA}},
+            }
+        },
+    )
+    async def upload_events(session_id: UUID, request: Request) -> dict[str, str]:
         """Upload events for a session."""
-        from cli2ansible.domain.models import Event
+        max_size = get_settings().max_upload_size
+        too_large = HTTPException(
+            status_code=413,
+            detail=f"Request body exceeds maximum allowed size ({max_size} bytes)",
+        )
+
+        # Reject oversized uploads from the header before reading the body
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_size:
+            raise too_large
+
+        # Read in chunks so a body without Content-Length is cut off at the limit
+        body = bytearray()
+        async for chunk in request.stream():
+            body += chunk
+            if len(body) > max_size:
+                raise too_large
+
+        try:
+            events = _EVENT_LIST_ADAPTER.validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            ) from e
 
         domain_events = [
             Event(
@@ -80,23 +155,27 @@ def create_app(
             )
             for e in events
         ]
-        ingest_service.save_events(session_id, domain_events)
+        await run_in_threadpool(ingest_service.save_events, session_id, domain_events)
         return {"status": "uploaded", "count": str(len(events))}
 
     @app.post("/sessions/{session_id}/compile", response_model=ArtifactResponse)
     async def compile_session(session_id: UUID, request: CompileRequest) -> Any:
         """Compile session to Ansible playbook."""
         # Extract commands first
-        ingest_service.extract_commands(session_id)
+        await run_in_threadpool(ingest_service.extract_commands, session_id)
 
         # Compile to role
-        role, report = compile_service.compile(session_id)
+        role, report = await run_in_threadpool(compile_service.compile, session_id)
 
         # Export artifact
-        artifact_key = compile_service.export_artifact(role, session_id)
+        artifact_key = await run_in_threadpool(
+            compile_service.export_artifact, role, session_id
+        )
 
         # Generate download URL
-        download_url = compile_service.store.generate_url(artifact_key)
+        download_url = await run_in_threadpool(
+            compile_service.store.generate_url, artifact_key
+        )
 
         return ArtifactResponse(
             artifact_url=artifact_key,
@@ -104,16 +183,22 @@ def create_app(
         )
 
     @app.get("/sessions/{session_id}/report", response_model=ReportResponse)
-    async def get_report(session_id: UUID) -> Any:
+    async def get_report(session_id: UUID, request: Request) -> Any:
         """Get translation report for a session."""
         session = compile_service.repo.get(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        # Re-compile to get report (in production, cache this)
-        role, report = compile_service.compile(session_id)
+        # Served from the compile cache unless the commands changed
+        role, report = await run_in_threadpool(compile_service.compile, session_id)
 
-        return ReportResponse(
+        etag = _etag(
+            report.session_id, report.total_commands, report.generated_at.isoformat()
+        )
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response = ReportResponse.model_construct(
             session_id=report.session_id,
             total_commands=report.total_commands,
             high_confidence=report.high_confidence,
@@ -123,15 +208,21 @@ def create_app(
             skipped_commands=report.skipped_commands,
             generated_at=report.generated_at,
         )
+        # Serialize with pydantic-core directly, skipping jsonable_encoder
+        return Response(
+            content=response.model_dump_json(),
+            media_type="application/json",
+            headers={"ETag": etag},
+        )
 
     @app.get("/sessions/{session_id}/playbook")
     async def download_playbook(session_id: UUID) -> StreamingResponse:
         """Download generated playbook artifact."""
         artifact_key = f"sessions/{session_id}/role.zip"
         try:
-            data = compile_service.store.download(artifact_key)
+            chunks = await run_in_threadpool(compile_service.store.stream, artifact_key)
             return StreamingResponse(
-                iter([data]),
+                chunks,
                 media_type="application/zip",
                 headers={
                     "Content-Disposition": f"attachment; filename=role_{session_id}.zip"
@@ -143,7 +234,10 @@ def create_app(
             ) from e
 
     @app.post("/sessions/{session_id}/clean", response_model=CleanSessionResponse)
-    async def clean_session(session_id: UUID) -> Any:
+    async def clean_session(
+        session_id: UUID,
+        clean_service: Annotated[CleanSession | None, Depends(get_clean_service)],
+    ) -> Any:
         """Clean terminal session by removing duplicates and error corrections."""
         if clean_service is None:
             raise HTTPException(
@@ -156,23 +250,25 @@ def create_app(
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Extract commands from events first
-        ingest_service.extract_commands(session_id)
+        await run_in_threadpool(ingest_service.extract_commands, session_id)
 
         # Validate command count before processing
-        from cli2ansible.settings import settings
-
         commands = ingest_service.repo.get_commands(session_id)
-        if len(commands) > settings.max_commands_for_cleaning:
+        max_commands = get_settings().max_commands_for_cleaning
+        if len(commands) > max_commands:
             raise HTTPException(
                 status_code=400,
-                detail=f"Session has {len(commands)} commands, maximum {settings.max_commands_for_cleaning} allowed for cleaning",
+                detail=f"Session has {len(commands)} commands, maximum {max_commands} allowed for cleaning",
             )
 
-        cleaned_commands, report = clean_service.clean_commands(session_id)
+        cleaned_commands, report = await run_in_threadpool(
+            clean_service.clean_commands, session_id
+        )
 
-        return CleanSessionResponse(
+        # Domain objects are already validated, so skip per-field validation
+        response = CleanSessionResponse.model_construct(
             cleaned_commands=[
-                CleanedCommandResponse(
+                CleanedCommandResponse.model_construct(
                     command=cmd.command,
                     reason=cmd.reason,
                     first_occurrence=cmd.first_occurrence,
@@ -182,7 +278,7 @@ def create_app(
                 )
                 for cmd in cleaned_commands
             ],
-            report=CleaningReportResponse(
+            report=CleaningReportResponse.model_construct(
                 session_id=report.session_id,
                 original_command_count=report.original_command_count,
                 cleaned_command_count=report.cleaned_command_count,
@@ -192,5 +288,8 @@ def create_app(
                 generated_at=report.generated_at,
             ),
         )
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
+        )
 
     return app
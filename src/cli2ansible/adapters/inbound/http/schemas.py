@@ -1,10 +1,10 @@
 """Pydantic schemas for API."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 
 class SessionCreate(BaseModel):
@@ -28,9 +28,11 @@ class SessionResponse(BaseModel):
 class EventCreate(BaseModel):
     """Request schema for creating events."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: float
-    event_type: str = Field(..., max_length=10)
-    data: str = Field(..., max_length=10000)
+    event_type: Annotated[str, StringConstraints(max_length=10)]
+    data: Annotated[str, StringConstraints(max_length=10000)]
     sequence: int = Field(default=0, ge=0)
 
 
@@ -1,18 +1,21 @@
 """Asciinema .cast file parser adapter."""
 
-import json
 import re
-from uuid import UUID
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID, uuid4
 
+import orjson
 from cli2ansible.domain.models import Event
 from cli2ansible.domain.ports import CapturePort
 
 # ANSI escape sequence pattern
 ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]|\x1B\][^\x07]*\x07|\x1B[\(\)][A-Za-z]')
 
-# OSC sequence pattern to extract window title (command)
+# OSC sequence to extract window title (command)
 # Format: ESC ] 2 ; command BEL
-OSC_TITLE_RE = re.compile(r'\x1B\]2;([^\x07]+)\x07')
+OSC_TITLE_PREFIX = "\x1b]2;"
+OSC_TITLE_END = "\x07"
 
 
 def strip_ansi(s: str) -> str:
@@ -22,9 +25,17 @@ def strip_ansi(s: str) -> str:
 
 def extract_command_from_osc(s: str) -> str | None:
     """Extract command from OSC window title sequence."""
-    match = OSC_TITLE_RE.search(s)
-    if match:
-        return match.group(1)
+    # Plain substring search; cheaper than a regex on long output chunks
+    start = s.find(OSC_TITLE_PREFIX)
+    while start >= 0:
+        start += len(OSC_TITLE_PREFIX)
+        end = s.find(OSC_TITLE_END, start)
+        if end < 0:
+            return None
+        if end > start:
+            return s[start:end]
+        # Empty title; try the next sequence
+        start = s.find(OSC_TITLE_PREFIX, end)
     return None
 
 
@@ -43,10 +54,27 @@ def apply_edit(buf: str, ch: str) -> str:
     return buf + ch
 
 
+def _loads_line(line: bytes) -> Any:
+    """Decode one JSON line, reporting invalid UTF-8 separately from bad JSON."""
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        try:
+            line.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Invalid UTF-8 encoding in .cast file: {e}") from e
+        raise
+
+
 class AsciinemaParser(CapturePort):
     """Parse asciinema .cast files into Event objects."""
 
-    def parse_events(self, recording_data: bytes, max_events: int = 100_000) -> list[Event]:
+    def parse_events(
+        self,
+        recording_data: bytes,
+        max_events: int = 100_000,
+        session_id: UUID | None = None,
+    ) -> list[Event]:
         """
         Parse asciinema .cast file format into Event objects.
 
@@ -64,26 +92,52 @@ class AsciinemaParser(CapturePort):
         Args:
             recording_data: Raw bytes from .cast file
             max_events: Maximum number of events to parse (default: 100,000)
+            session_id: Session ID to assign to events (default: a new UUID)
 
         Returns:
             List of Event objects containing completed commands
 
         Raises:
             ValueError: If file format is invalid or exceeds limits
-            json.JSONDecodeError: If JSON parsing fails
+            orjson.JSONDecodeError: If JSON parsing fails
         """
-        try:
-            lines = recording_data.decode("utf-8").strip().split("\n")
-        except UnicodeDecodeError as e:
-            raise ValueError(f"Invalid UTF-8 encoding in .cast file: {e}") from e
+        return self.parse_events_stream(
+            recording_data.split(b"\n"), max_events, session_id
+        )
+
+    def parse_events_stream(
+        self,
+        line_iter: Iterable[bytes],
+        max_events: int = 100_000,
+        session_id: UUID | None = None,
+    ) -> list[Event]:
+        """
+        Parse asciinema .cast lines into Event objects, one line at a time.
+
+        Accepts any iterable of raw lines (such as a file opened in binary mode),
+        so the recording never has to be held in memory as a single string.
+
+        Args:
+            line_iter: Raw lines of a .cast file, with or without trailing newlines
+            max_events: Maximum number of events to parse (default: 100,000)
+            session_id: Session ID to assign to events (default: a new UUID)
+
+        Returns:
+            List of Event objects containing completed commands
 
-        if not lines or not lines[0]:
+        Raises:
+            ValueError: If file format is invalid or exceeds limits
+        """
+        lines = iter(line_iter)
+
+        # Parse header (first non-blank line)
+        header_line = next((line for line in lines if line.strip()), None)
+        if header_line is None:
             raise ValueError("Empty .cast file")
 
-        # Parse header (line 1)
         try:
-            header = json.loads(lines[0])
-        except json.JSONDecodeError as e:
+            header = _loads_line(header_line)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON header in .cast file: {e}") from e
 
         # Validate header structure
@@ -97,84 +151,69 @@ class AsciinemaParser(CapturePort):
                 "Only versions 2 and 3 are supported."
             )
 
-        # Generate a session ID
-        from uuid import uuid4
-
-        session_id = uuid4()
+        # Generate a session ID unless the caller supplied one
+        if session_id is None:
+            session_id = uuid4()
 
-        # First pass: find the minimum timestamp to use as base
+        # Parse all events into a list, tracking the minimum timestamp to use
+        # as base in the same pass so each line is decoded only once. Only Enter
+        # keypresses and well-formed output rows are kept, as (t, kind, data).
+        number = (int, float)
         base_t = None
-        for line in lines[1:]:
+        all_events: list[tuple[Any, str, Any]] = []
+        for line in lines:
             if not line.strip():
                 continue
             try:
-                event_data = json.loads(line)
-                if isinstance(event_data, list) and len(event_data) >= 1:
-                    t = event_data[0]
-                    if isinstance(t, int | float) and (base_t is None or t < base_t):
-                        base_t = t
-            except (json.JSONDecodeError, IndexError):
+                event_data = _loads_line(line)
+            except orjson.JSONDecodeError:
                 continue
+            if isinstance(event_data, list) and len(event_data) >= 1:
+                t = event_data[0]
+                is_number = isinstance(t, number)
+                if is_number and (base_t is None or t < base_t):
+                    base_t = t
+                if len(event_data) >= 3:
+                    kind = event_data[1]
+                    data = event_data[2]
+                    if (kind == "i" and data == "\r") or (
+                        kind == "o" and is_number and isinstance(data, str)
+                    ):
+                        all_events.append((t, kind, data))
 
         if base_t is None:
             base_t = 0
 
-        # Second pass: extract commands and their enter timestamps
-        # Strategy: Find OSC title events, then look backwards for the corresponding Enter keypress
+        # Extract commands and their enter timestamps
+        # Strategy: Find OSC title events and pair each with the most recent Enter
+        # keypress seen so far. v3 timestamps are intervals, so "most recent" is by
+        # position in the file, tracked in a single forward pass.
         events: list[Event] = []
+        append = events.append
         seq = 0
-
-        # Parse all events into a list first
-        all_events = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            try:
-                event_data = json.loads(line)
-                if isinstance(event_data, list) and len(event_data) >= 3:
-                    all_events.append(event_data)
-            except json.JSONDecodeError:
-                continue
+        last_enter = None
 
         # Find commands and their timestamps
-        for i, event_data in enumerate(all_events):
-            t = event_data[0]
-            kind = event_data[1]
-            data = event_data[2]
-
-            if not isinstance(t, int | float) or not isinstance(kind, str) or not isinstance(data, str):
+        for t, kind, data in all_events:
+            # Remember the latest Enter keypress
+            if kind == "i":
+                last_enter = t
                 continue
 
             # Extract commands from OSC window title sequences in output
-            if kind == "o":
-                cmd = extract_command_from_osc(data)
-                if cmd and cmd not in ("cd", "pbooth@USMBP16PBOOTH:~/personal-projects/scratch", "pbooth@USMBP16PBOOTH:~/personal-projects/scratch/test_1"):
-                    # Look backwards to find the most recent Enter keypress
-                    enter_time = t
-                    for j in range(i - 1, -1, -1):
-                        prev_event = all_events[j]
-                        if (len(prev_event) >= 3 and
-                            prev_event[1] == "i" and
-                            prev_event[2] == "\r"):
-                            enter_time = prev_event[0]
-                            break
-
-                    # Enforce event count limit
-                    if seq >= max_events:
-                        raise ValueError(
-                            f"Event count exceeds maximum allowed limit ({max_events})"
-                        )
-
-                    events.append(
-                        Event(
-                            session_id=session_id,
-                            timestamp=round(enter_time - base_t, 6),
-                            event_type="o",
-                            data=cmd,
-                            sequence=seq,
-                        )
+            cmd = extract_command_from_osc(data)
+            if cmd and cmd not in ("cd", "pbooth@USMBP16PBOOTH:~/personal-projects/scratch", "pbooth@USMBP16PBOOTH:~/personal-projects/scratch/test_1"):
+                enter_time = t if last_enter is None else last_enter
+
+                # Enforce event count limit
+                if seq >= max_events:
+                    raise ValueError(
+                        f"Event count exceeds maximum allowed limit ({max_events})"
                     )
-                    seq += 1
+
+                # Positional args skip keyword binding in this hot loop
+                append(Event(session_id, round(enter_time - base_t, 6), "o", cmd, seq))
+                seq += 1
 
         return events
 
@@ -209,15 +248,6 @@ def parse_cast_file(
             f"size ({max_file_size} bytes)"
         )
 
-    with open(file_path, "rb") as f:
-        data = f.read()
-
     parser = AsciinemaParser()
-    events = parser.parse_events(data)
-
-    # Override session_id if provided
-    if session_id is not None:
-        for event in events:
-            event.session_id = session_id
-
-    return events
+    with open(file_path, "rb") as f:
+        return parser.parse_events_stream(f, session_id=session_id)
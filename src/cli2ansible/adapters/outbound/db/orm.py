@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import JSON, Float, Integer, String, Text
+from sqlalchemy import JSON, Float, Index, Integer, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -37,9 +37,11 @@ class EventORM(Base):
     """Event table."""
 
     __tablename__ = "events"
+    # Matches get_events: filter by session, return rows already in sequence order
+    __table_args__ = (Index("ix_events_session_seq", "session_id", "sequence"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(String(36), nullable=False)
     timestamp: Mapped[float] = mapped_column(Float, nullable=False)
     event_type: Mapped[str] = mapped_column(String(10), nullable=False)
     data: Mapped[str] = mapped_column(Text, nullable=False)
@@ -50,9 +52,11 @@ class CommandORM(Base):
     """Command table."""
 
     __tablename__ = "commands"
+    # Matches get_commands: filter by session, return rows already in time order
+    __table_args__ = (Index("ix_commands_session_ts", "session_id", "timestamp"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(String(36), nullable=False)
     raw: Mapped[str] = mapped_column(Text, nullable=False)
     normalized: Mapped[str] = mapped_column(Text, nullable=False)
     cwd: Mapped[str] = mapped_column(String(512), nullable=False, default="/")
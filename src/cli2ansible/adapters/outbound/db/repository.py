@@ -1,16 +1,53 @@
 """SQLAlchemy repository implementation."""
 
+import sys
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, cast
 from uuid import UUID
 
+import orjson
 from cli2ansible.domain.models import Command, Event, SessionStatus
 from cli2ansible.domain.models import Session as DomainSession
 from cli2ansible.domain.ports import SessionRepositoryPort
-from sqlalchemy import create_engine, select
+from sqlalchemy import (
+    CursorResult,
+    create_engine,
+    delete,
+    event,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from .orm import Base, CommandORM, EventORM, SessionORM
 
+# Applied to every new connection of a file-backed SQLite database: WAL with
+# synchronous=NORMAL avoids an fsync per commit on batched event/command writes
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns (session metadata) with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply write-throughput pragmas to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class SQLAlchemyRepository(SessionRepositoryPort):
     """SQLAlchemy implementation of session repository."""
@@ -31,106 +68,203 @@ class SQLAlchemyRepository(SessionRepositoryPort):
             database_url,
             connect_args=connect_args,
             poolclass=poolclass,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
+        if database_url.startswith("sqlite") and ":memory:" not in database_url:
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def create_tables(self) -> None:
         """Create database tables."""
         Base.metadata.create_all(self.engine)
 
-    def create(self, session: DomainSession) -> DomainSession:
-        """Create a new session."""
+    @contextmanager
+    def unit_of_work(self) -> Iterator[OrmSession]:
+        """
+        Share one database session across several repository calls.
+
+        Pass the yielded session as ``db=`` to the repository methods; it is
+        committed once on exit, or rolled back if the block raises.
+        """
         with self.SessionLocal() as db:
+            try:
+                yield db
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+    def _session(self, db: OrmSession | None) -> AbstractContextManager[OrmSession]:
+        """Use the caller's session if given, otherwise open a new one."""
+        return nullcontext(db) if db is not None else self.SessionLocal()
+
+    def create(
+        self, session: DomainSession, *, db: OrmSession | None = None
+    ) -> DomainSession:
+        """Create a new session."""
+        with self._session(db) as s:
             orm_session = SessionORM(
                 id=str(session.id),
                 name=session.name,
                 status=session.status.value,
                 session_metadata=session.metadata,
+                created_at=session.created_at,
+                updated_at=session.updated_at,
             )
-            db.add(orm_session)
-            db.commit()
-            db.refresh(orm_session)
+            s.add(orm_session)
+            if db is None:
+                s.commit()
+            else:
+                s.flush()
+            s.refresh(orm_session)
             return self._to_domain(orm_session)
 
-    def get(self, session_id: UUID) -> DomainSession | None:
+    def get(
+        self, session_id: UUID, *, db: OrmSession | None = None
+    ) -> DomainSession | None:
         """Retrieve a session by ID."""
-        with self.SessionLocal() as db:
+        with self._session(db) as s:
             stmt = select(SessionORM).where(SessionORM.id == str(session_id))
-            orm_session = db.scalar(stmt)
+            orm_session = s.scalar(stmt)
             return self._to_domain(orm_session) if orm_session else None
 
-    def update(self, session: DomainSession) -> DomainSession:
+    def update(
+        self, session: DomainSession, *, db: OrmSession | None = None
+    ) -> DomainSession:
         """Update session."""
-        with self.SessionLocal() as db:
+        with self._session(db) as s:
             stmt = select(SessionORM).where(SessionORM.id == str(session.id))
-            orm_session = db.scalar(stmt)
+            orm_session = s.scalar(stmt)
             if not orm_session:
                 raise ValueError(f"Session {session.id} not found")
 
             orm_session.name = session.name
             orm_session.status = session.status.value
             orm_session.session_metadata = session.metadata
-            db.commit()
-            db.refresh(orm_session)
+            if db is None:
+                s.commit()
+            else:
+                s.flush()
+            s.refresh(orm_session)
             return self._to_domain(orm_session)
 
-    def save_events(self, events: list[Event]) -> None:
+    def update_status(
+        self,
+        session_id: UUID,
+        status: SessionStatus,
+        *,
+        db: OrmSession | None = None,
+    ) -> bool:
+        """Set a session's status with a single UPDATE (no prior SELECT)."""
+        with self._session(db) as s:
+            result = cast(
+                CursorResult[Any],
+                s.execute(
+                    update(SessionORM)
+                    .where(SessionORM.id == str(session_id))
+                    .values(status=status.value),
+                    execution_options={"synchronize_session": False},
+                ),
+            )
+            if db is None:
+                s.commit()
+            else:
+                s.flush()
+            return bool(result.rowcount)
+
+    def save_events(self, events: list[Event], *, db: OrmSession | None = None) -> None:
         """Save events for a session."""
-        with self.SessionLocal() as db:
-            orm_events = [
-                EventORM(
-                    session_id=str(event.session_id),
-                    timestamp=event.timestamp,
-                    event_type=event.event_type,
-                    data=event.data,
-                    sequence=event.sequence,
-                )
-                for event in events
-            ]
-            db.add_all(orm_events)
-            db.commit()
-
-    def get_events(self, session_id: UUID) -> list[Event]:
+        if not events:
+            return
+        # Core executemany insert: skips the ORM unit of work for each row
+        rows = [
+            {
+                "session_id": str(event.session_id),
+                "timestamp": event.timestamp,
+                "event_type": event.event_type,
+                "data": event.data,
+                "sequence": event.sequence,
+            }
+            for event in events
+        ]
+        with self._session(db) as s:
+            s.execute(insert(EventORM), rows)
+            if db is None:
+                s.commit()
+
+    def get_events(
+        self, session_id: UUID, *, db: OrmSession | None = None
+    ) -> list[Event]:
         """Get all events for a session."""
-        with self.SessionLocal() as db:
+        with self._session(db) as s:
             stmt = (
                 select(EventORM)
                 .where(EventORM.session_id == str(session_id))
                 .order_by(EventORM.sequence)
             )
-            orm_events = db.scalars(stmt).all()
-            return [self._event_to_domain(e) for e in orm_events]
+            orm_events = s.scalars(stmt).all()
+            # Every row belongs to session_id; reuse it instead of parsing
+            # a UUID from the string column per row
+            return [self._event_to_domain(e, session_id) for e in orm_events]
 
-    def save_commands(self, commands: list[Command]) -> None:
+    def save_commands(
+        self, commands: list[Command], *, db: OrmSession | None = None
+    ) -> None:
         """Save parsed commands."""
-        with self.SessionLocal() as db:
-            orm_commands = [
-                CommandORM(
-                    session_id=str(cmd.session_id),
-                    raw=cmd.raw,
-                    normalized=cmd.normalized,
-                    cwd=cmd.cwd,
-                    user=cmd.user,
-                    sudo=cmd.sudo,
-                    timestamp=cmd.timestamp,
-                    exit_code=cmd.exit_code,
-                    output=cmd.output,
-                )
-                for cmd in commands
-            ]
-            db.add_all(orm_commands)
-            db.commit()
-
-    def get_commands(self, session_id: UUID) -> list[Command]:
+        if not commands:
+            return
+        with self._session(db) as s:
+            s.execute(insert(CommandORM), self._command_rows(commands))
+            if db is None:
+                s.commit()
+
+    def replace_commands(
+        self,
+        session_id: UUID,
+        commands: list[Command],
+        *,
+        db: OrmSession | None = None,
+    ) -> None:
+        """Replace all stored commands of a session in one transaction."""
+        with self._session(db) as s:
+            s.execute(
+                delete(CommandORM).where(CommandORM.session_id == str(session_id))
+            )
+            if commands:
+                s.execute(insert(CommandORM), self._command_rows(commands))
+            if db is None:
+                s.commit()
+
+    def _command_rows(self, commands: list[Command]) -> list[dict[str, Any]]:
+        """Build insert rows for commands."""
+        return [
+            {
+                "session_id": str(cmd.session_id),
+                "raw": cmd.raw,
+                "normalized": cmd.normalized,
+                "cwd": cmd.cwd,
+                "user": cmd.user,
+                "sudo": cmd.sudo,
+                "timestamp": cmd.timestamp,
+                "exit_code": cmd.exit_code,
+                "output": cmd.output,
+            }
+            for cmd in commands
+        ]
+
+    def get_commands(
+        self, session_id: UUID, *, db: OrmSession | None = None
+    ) -> list[Command]:
         """Get all commands for a session."""
-        with self.SessionLocal() as db:
+        with self._session(db) as s:
             stmt = (
                 select(CommandORM)
                 .where(CommandORM.session_id == str(session_id))
                 .order_by(CommandORM.timestamp)
             )
-            orm_commands = db.scalars(stmt).all()
-            return [self._command_to_domain(c) for c in orm_commands]
+            orm_commands = s.scalars(stmt).all()
+            return [self._command_to_domain(c, session_id) for c in orm_commands]
 
     def _to_domain(self, orm_session: SessionORM) -> DomainSession:
         """Convert ORM to domain model."""
@@ -143,20 +277,21 @@ class SQLAlchemyRepository(SessionRepositoryPort):
             metadata=orm_session.session_metadata,
         )
 
-    def _event_to_domain(self, orm_event: EventORM) -> Event:
+    def _event_to_domain(self, orm_event: EventORM, session_id: UUID) -> Event:
         """Convert ORM event to domain model."""
         return Event(
-            session_id=UUID(orm_event.session_id),
+            session_id=session_id,
             timestamp=orm_event.timestamp,
-            event_type=orm_event.event_type,
+            # Event types are a handful of short codes; share one str per code
+            event_type=sys.intern(orm_event.event_type),
             data=orm_event.data,
             sequence=orm_event.sequence,
         )
 
-    def _command_to_domain(self, orm_cmd: CommandORM) -> Command:
+    def _command_to_domain(self, orm_cmd: CommandORM, session_id: UUID) -> Command:
         """Convert ORM command to domain model."""
         return Command(
-            session_id=UUID(orm_cmd.session_id),
+            session_id=session_id,
             raw=orm_cmd.raw,
             normalized=orm_cmd.normalized,
             cwd=orm_cmd.cwd,
@@ -2,5 +2,6 @@
 
 from cli2ansible.adapters.outbound.llm.anthropic_cleaner import AnthropicCleaner
 from cli2ansible.adapters.outbound.llm.openai_cleaner import OpenAICleaner
+from cli2ansible.adapters.outbound.llm.rate_limiter import RateLimiter
 
-__all__ = ["AnthropicCleaner", "OpenAICleaner"]
+__all__ = ["AnthropicCleaner", "OpenAICleaner", "RateLimiter"]
@@ -1,53 +1,31 @@
 """OpenAI-based terminal session cleaner."""
 
-import json
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 from uuid import UUID
 
 import httpx
+import orjson
+from cli2ansible.adapters.outbound.llm.rate_limiter import RateLimiter
 from cli2ansible.domain.models import CleanedCommand, CleaningReport, Command
 from cli2ansible.domain.ports import LLMPort
 
+# Rate limits and transient server errors worth retrying
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+# Upper bound on a single backoff sleep (seconds)
+_MAX_RETRY_DELAY = 60.0
+# Maximum number of API responses kept for repeated identical prompts
+_RESPONSE_CACHE_SIZE = 128
 
-class OpenAICleaner(LLMPort):
-    """Use OpenAI GPT to clean terminal sessions."""
-
-    def __init__(self, api_key: str, model: str = "gpt-4o") -> None:
-        self.api_key = api_key
-        self.model = model
-        self.base_url = "https://api.openai.com/v1/chat/completions"
-
-    def clean_commands(
-        self, commands: list[Command], session_id: UUID
-    ) -> tuple[list[CleanedCommand], CleaningReport]:
-        """Analyze and clean terminal commands using OpenAI."""
-        if not commands:
-            return [], CleaningReport(
-                session_id=session_id,
-                original_command_count=0,
-                cleaned_command_count=0,
-                duplicates_removed=0,
-                error_corrections_removed=0,
-                cleaning_rationale="No commands to clean",
-            )
-
-        prompt = self._build_prompt(commands)
-        response = self._call_api(prompt)
-        return self._parse_response(response, commands, session_id)
-
-    def _build_prompt(self, commands: list[Command]) -> str:
-        """Build the prompt for OpenAI."""
-        cmd_list = "\n".join(
-            [
-                f"{i+1}. {cmd.raw} (timestamp: {cmd.timestamp})"
-                for i, cmd in enumerate(commands)
-            ]
-        )
-
-        return f"""Analyze the following terminal session commands and identify which ones are essential.
+# Static cleaning instructions; only the command list (%s) varies per call
+_PROMPT_TEMPLATE = """Analyze the following terminal session commands and identify which ones are essential.
 
 Commands:
-{cmd_list}
+%s
 
 Your task:
 1. Identify duplicate commands (same command run multiple times)
@@ -55,27 +33,27 @@ Your task:
 3. Keep only the essential commands needed to reproduce the desired outcome
 
 Return a JSON response with this structure:
-{{
+{
   "essential_commands": [
-    {{
+    {
       "command": "the actual command",
       "reason": "why this command is essential",
       "is_duplicate": false,
       "is_error_correction": false,
       "first_occurrence_index": 0
-    }}
+    }
   ],
   "removed_commands": [
-    {{
+    {
       "command": "the removed command",
       "reason": "why it was removed (duplicate/error correction)",
       "is_duplicate": true,
       "is_error_correction": false,
       "original_index": 5
-    }}
+    }
   ],
   "rationale": "overall explanation of cleaning decisions"
-}}
+}
 
 Focus on:
 - Commands that accomplish the goal (keep)
@@ -83,6 +61,95 @@ Focus on:
 - Repeated identical commands (keep only first occurrence)
 - Failed commands followed by successful ones (remove failures)"""
 
+
+class OpenAICleaner(LLMPort):
+    """Use OpenAI GPT to clean terminal sessions."""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        max_retries: int = 3,
+        max_output_tokens: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.model = model
+        self.max_retries = max_retries
+        self.max_output_tokens = max_output_tokens
+        self.rate_limiter = rate_limiter or RateLimiter.for_provider("openai")
+        self.base_url = "https://api.openai.com/v1/chat/completions"
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        # blake2b(model + prompt) -> raw API response
+        self._response_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def __enter__(self) -> "OpenAICleaner":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        # One client per cleaner keeps TCP/TLS connections alive between calls
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=60.0)
+            return self._client
+
+    def clean_commands(
+        self, commands: list[Command], session_id: UUID
+    ) -> tuple[list[CleanedCommand], CleaningReport]:
+        """Analyze and clean terminal commands using OpenAI."""
+        if not commands:
+            return [], CleaningReport(
+                session_id=session_id,
+                original_command_count=0,
+                cleaned_command_count=0,
+                duplicates_removed=0,
+                error_corrections_removed=0,
+                cleaning_rationale="No commands to clean",
+            )
+
+        prompt = self._build_prompt(commands)
+        key = hashlib.blake2b(
+            f"{self.model}\0{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+        if cached is not None:
+            return self._parse_response(cached, commands, session_id)
+
+        response = self._call_api(prompt)
+        result = self._parse_response(response, commands, session_id)
+
+        # Only cache responses that parsed, so a bad answer is retried next time
+        with self._cache_lock:
+            self._response_cache[key] = response
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return result
+
+    def _build_prompt(self, commands: list[Command]) -> str:
+        """Build the prompt for OpenAI."""
+        cmd_list = "\n".join(
+            f"{i+1}. {cmd.raw} (timestamp: {cmd.timestamp})"
+            for i, cmd in enumerate(commands)
+        )
+        return _PROMPT_TEMPLATE % cmd_list
+
     def _call_api(self, prompt: str) -> dict[str, Any]:
         """Call the OpenAI API."""
         headers = {
@@ -90,7 +157,7 @@ Focus on:
             "Content-Type": "application/json",
         }
 
-        payload = {
+        payload: dict[str, Any] = {
             "model": self.model,
             "messages": [
                 {
@@ -102,22 +169,54 @@ Focus on:
             "temperature": 0.3,
             "response_format": {"type": "json_object"},
         }
+        if self.max_output_tokens is not None:
+            payload["max_tokens"] = self.max_output_tokens
 
-        try:
-            with httpx.Client(timeout=60.0) as client:
+        # Rough token estimate (~4 characters per token) until usage is known
+        estimated_tokens = len(prompt) // 4
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            reservation = self.rate_limiter.acquire(estimated_tokens)
+            used_tokens = None
+            try:
+                client = self._get_client()
                 response = client.post(self.base_url, headers=headers, json=payload)
                 response.raise_for_status()
                 result: dict[str, Any] = response.json()
+                total = result.get("usage", {}).get("total_tokens")
+                used_tokens = total if isinstance(total, int) else None
                 return result
-        except httpx.HTTPStatusError as e:
-            # Don't expose response content in error
-            raise RuntimeError(
-                f"OpenAI API request failed with status {e.response.status_code}"
-            ) from e
-        except httpx.TimeoutException as e:
-            raise RuntimeError("OpenAI API request timed out") from e
-        except Exception as e:
-            raise RuntimeError("Failed to call OpenAI API") from e
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if last_attempt or status not in _RETRYABLE_STATUS:
+                    # Don't expose response content in error
+                    raise RuntimeError(
+                        f"OpenAI API request failed with status {status}"
+                    ) from e
+                delay = self._retry_delay(attempt, e.response)
+            except httpx.TimeoutException as e:
+                if last_attempt:
+                    raise RuntimeError("OpenAI API request timed out") from e
+                delay = self._retry_delay(attempt, None)
+            except Exception as e:
+                raise RuntimeError("Failed to call OpenAI API") from e
+            finally:
+                self.rate_limiter.release(reservation, used_tokens)
+            time.sleep(delay)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Seconds to wait before retrying: Retry-After if given, else backoff."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+                except ValueError:
+                    pass
+        # Exponential backoff with jitter so parallel clients don't retry in step
+        return min(2.0**attempt + random.uniform(0, 1), _MAX_RETRY_DELAY)
 
     def _parse_response(
         self,
@@ -136,17 +235,24 @@ Focus on:
         if not content:
             raise ValueError("Empty content in API response")
 
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         cleaned_commands: list[CleanedCommand] = []
         duplicates_removed = 0
         error_corrections_removed = 0
 
+        # First occurrence of each command text, for answers whose index is off
+        by_text: dict[str, Command] = {}
+        for cmd in original_commands:
+            by_text.setdefault(cmd.raw, cmd)
+
         # Process essential commands
         for cmd_data in data.get("essential_commands", []):
             idx = cmd_data.get("first_occurrence_index", 0)
             original_cmd = (
-                original_commands[idx] if idx < len(original_commands) else None
+                original_commands[idx]
+                if idx < len(original_commands)
+                else by_text.get(cmd_data["command"])
             )
 
             if original_cmd:
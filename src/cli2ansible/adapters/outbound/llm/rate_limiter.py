@@ -0,0 +1,100 @@
+"""Client-side rate limiting for LLM provider APIs."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RateLimitProfile:
+    """Request, token and concurrency limits for one provider."""
+
+    rpm: int
+    tpm: int
+    max_concurrent: int
+
+
+# Conservative defaults; raise them to match the account's actual tier
+PROVIDER_PROFILES: dict[str, RateLimitProfile] = {
+    "openai": RateLimitProfile(rpm=60, tpm=150_000, max_concurrent=10),
+    "anthropic": RateLimitProfile(rpm=50, tpm=40_000, max_concurrent=5),
+}
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter for requests and tokens per minute.
+
+    Callers block in acquire() until the request fits under the provider's
+    limits, then hand back the reservation with release() once the response
+    (and its real token usage) is known.
+    """
+
+    def __init__(
+        self,
+        profile: RateLimitProfile,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.profile = profile
+        self.window = window
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(profile.max_concurrent)
+        self._requests: deque[float] = deque()
+        self._tokens: deque[list[float]] = deque()
+        self._token_total = 0.0
+
+    @classmethod
+    def for_provider(cls, provider: str) -> "RateLimiter":
+        """Create a limiter pre-seeded with a known provider profile."""
+        return cls(PROVIDER_PROFILES[provider])
+
+    def acquire(self, estimated_tokens: int) -> list[float]:
+        """Block until a request fits; returns its [timestamp, tokens] reservation."""
+        self._slots.acquire()
+        try:
+            while True:
+                with self._lock:
+                    now = self._clock()
+                    self._prune(now)
+                    wait = 0.0
+                    if len(self._requests) >= self.profile.rpm:
+                        wait = self._requests[0] + self.window - now
+                    # A single oversized request is let through on an empty window
+                    if self._tokens and (
+                        self._token_total + estimated_tokens > self.profile.tpm
+                    ):
+                        wait = max(wait, self._tokens[0][0] + self.window - now)
+                    if wait <= 0:
+                        entry = [now, float(estimated_tokens)]
+                        self._requests.append(now)
+                        self._tokens.append(entry)
+                        self._token_total += estimated_tokens
+                        return entry
+                self._sleep(wait)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, entry: list[float], actual_tokens: int | None = None) -> None:
+        """Free the concurrency slot, correcting the token estimate if known."""
+        if actual_tokens is not None:
+            with self._lock:
+                # Entries already pruned from the window no longer count
+                if self._tokens and entry[0] >= self._tokens[0][0]:
+                    self._token_total += actual_tokens - entry[1]
+                entry[1] = float(actual_tokens)
+        self._slots.release()
+
+    def _prune(self, now: float) -> None:
+        """Drop requests and token usage that have left the window."""
+        cutoff = now - self.window
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
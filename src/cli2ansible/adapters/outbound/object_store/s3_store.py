@@ -1,9 +1,51 @@
 """S3/MinIO object store adapter."""
 
+import io
+import threading
+from collections.abc import Iterator
+from typing import BinaryIO
+
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from cli2ansible.domain.ports import ObjectStorePort
 
+# Artifacts at or above this size are sent as parallel multipart uploads
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_THRESHOLD,
+    multipart_chunksize=_MULTIPART_THRESHOLD,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# Larger connection pool for parallel part uploads/downloads, and adaptive
+# retries that back off client-side when S3 starts throttling
+_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+# (endpoint, bucket) pairs already known to exist in this process
+_verified_buckets: set[tuple[str, str]] = set()
+_verified_buckets_lock = threading.Lock()
+
+
+def _remaining_size(data: bytes | BinaryIO) -> int | None:
+    """Return the bytes left to upload, or None for non-seekable streams."""
+    if isinstance(data, bytes):
+        return len(data)
+    if not data.seekable():
+        return None
+    position = data.tell()
+    end = data.seek(0, io.SEEK_END)
+    data.seek(position)
+    return end - position
+
 
 class S3ObjectStore(ObjectStorePort):
     """S3-compatible object store implementation."""
@@ -16,6 +58,7 @@ class S3ObjectStore(ObjectStorePort):
         bucket: str,
         region: str = "us-east-1",
     ) -> None:
+        self.endpoint = endpoint
         self.bucket = bucket
         self.client = boto3.client(
             "s3",
@@ -23,24 +66,45 @@ class S3ObjectStore(ObjectStorePort):
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
             region_name=region,
-            config=Config(signature_version="s3v4"),
+            config=_CLIENT_CONFIG,
         )
         self._ensure_bucket()
 
     def _ensure_bucket(self) -> None:
         """Create bucket if it doesn't exist."""
+        bucket_id = (self.endpoint, self.bucket)
+        with _verified_buckets_lock:
+            if bucket_id in _verified_buckets:
+                return
         try:
             self.client.head_bucket(Bucket=self.bucket)
         except Exception:
             self.client.create_bucket(Bucket=self.bucket)
+        with _verified_buckets_lock:
+            _verified_buckets.add(bucket_id)
 
     def upload(
-        self, key: str, data: bytes, content_type: str = "application/octet-stream"
+        self,
+        key: str,
+        data: bytes | BinaryIO,
+        content_type: str = "application/octet-stream",
     ) -> str:
         """Upload artifact and return URL."""
-        self.client.put_object(
-            Bucket=self.bucket, Key=key, Body=data, ContentType=content_type
-        )
+        size = _remaining_size(data)
+        if size is not None and size < _MULTIPART_THRESHOLD:
+            # Small artifacts: one PUT, no transfer manager threads
+            self.client.put_object(
+                Bucket=self.bucket, Key=key, Body=data, ContentType=content_type
+            )
+        else:
+            # Streams from the file object in parts instead of buffering it whole
+            self.client.upload_fileobj(
+                Fileobj=io.BytesIO(data) if isinstance(data, bytes) else data,
+                Bucket=self.bucket,
+                Key=key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
+            )
         return f"{self.bucket}/{key}"
 
     def download(self, key: str) -> bytes:
@@ -49,6 +113,12 @@ class S3ObjectStore(ObjectStorePort):
         body_data: bytes = response["Body"].read()
         return body_data
 
+    def stream(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Download artifact as an iterator of chunks."""
+        response = self.client.get_object(Bucket=self.bucket, Key=key)
+        chunks: Iterator[bytes] = response["Body"].iter_chunks(chunk_size)
+        return chunks
+
     def delete(self, key: str) -> None:
         """Delete artifact."""
         self.client.delete_object(Bucket=self.bucket, Key=key)
@@ -1,31 +1,224 @@
 """Rule-based command to Ansible task translator."""
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 from cli2ansible.domain.models import Command, Task, TaskConfidence
 from cli2ansible.domain.ports import TranslatorPort
 
+# Leading program name; every rule pattern below starts with a literal one
+HEAD_RE = re.compile(r"\S+")
+
+APT_INSTALL_RE = re.compile(r"apt(?:-get)?\s+install\s+(?:-y\s+)?(.+)")
+YUM_INSTALL_RE = re.compile(r"yum\s+install\s+(?:-y\s+)?(.+)")
+DNF_INSTALL_RE = re.compile(r"dnf\s+install\s+(?:-y\s+)?(.+)")
+SYSTEMCTL_RE = re.compile(r"systemctl\s+(start|stop|restart|enable|disable)\s+(\S+)")
+MKDIR_RE = re.compile(r"mkdir\s+(?:-p\s+)?(.+)")
+COPY_RE = re.compile(r"cp\s+(?:-r\s+)?(\S+)\s+(\S+)")
+GIT_CLONE_RE = re.compile(r"git\s+clone\s+(\S+)(?:\s+(\S+))?")
+PIP_INSTALL_RE = re.compile(r"pip[3]?\s+install\s+(.+)")
+NPM_INSTALL_RE = re.compile(r"npm\s+install\s+(?:-g\s+)?(.+)")
+USERADD_RE = re.compile(r"useradd\s+(?:-m\s+)?(\S+)")
+CHOWN_RE = re.compile(r"chown\s+(?:-R\s+)?(\S+)\s+(.+)")
+CHMOD_RE = re.compile(r"chmod\s+(?:-R\s+)?(\S+)\s+(.+)")
+
+SYSTEMD_STATES = {"start": "started", "stop": "stopped", "restart": "restarted"}
+
+
+def _apt_install(match: re.Match[str], command: Command) -> Task:
+    """Translate apt install commands."""
+    packages = match.group(1).strip().split()
+    return Task(
+        name=f"Install packages: {', '.join(packages)}",
+        module="apt",
+        args={"name": packages, "state": "present", "update_cache": True},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _yum_install(match: re.Match[str], command: Command) -> Task:
+    """Translate yum install commands."""
+    packages = match.group(1).strip().split()
+    return Task(
+        name=f"Install packages: {', '.join(packages)}",
+        module="yum",
+        args={"name": packages, "state": "present"},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _dnf_install(match: re.Match[str], command: Command) -> Task:
+    """Translate dnf install commands."""
+    packages = match.group(1).strip().split()
+    return Task(
+        name=f"Install packages: {', '.join(packages)}",
+        module="dnf",
+        args={"name": packages, "state": "present"},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _systemctl(match: re.Match[str], command: Command) -> Task:
+    """Translate systemctl commands."""
+    action, service = match.groups()
+    if action in SYSTEMD_STATES:
+        args: dict[str, Any] = {"name": service, "state": SYSTEMD_STATES[action]}
+    else:
+        # enable / disable
+        args = {"name": service, "enabled": action == "enable"}
+    return Task(
+        name=f"{action.capitalize()} service: {service}",
+        module="systemd",
+        args=args,
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _mkdir(match: re.Match[str], command: Command) -> Task:
+    """Translate mkdir commands."""
+    path = match.group(1).strip()
+    return Task(
+        name=f"Create directory: {path}",
+        module="file",
+        args={"path": path, "state": "directory"},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _copy_file(match: re.Match[str], command: Command) -> Task:
+    """Translate cp commands."""
+    src, dest = match.groups()
+    return Task(
+        name=f"Copy {src} to {dest}",
+        module="copy",
+        args={"src": src, "dest": dest},
+        confidence=TaskConfidence.MEDIUM,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _git_clone(match: re.Match[str], command: Command) -> Task:
+    """Translate git clone commands."""
+    repo = match.group(1)
+    dest = match.group(2) or repo.split("/")[-1].replace(".git", "")
+    return Task(
+        name=f"Clone repository: {repo}",
+        module="git",
+        args={"repo": repo, "dest": dest},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        creates=dest,
+    )
+
+
+def _pip_install(match: re.Match[str], command: Command) -> Task:
+    """Translate pip install commands."""
+    packages = match.group(1).strip().split()
+    return Task(
+        name=f"Install Python packages: {', '.join(packages)}",
+        module="pip",
+        args={"name": packages, "state": "present"},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+    )
+
+
+def _npm_install(match: re.Match[str], command: Command) -> Task:
+    """Translate npm install commands."""
+    packages = match.group(1).strip().split()
+    is_global = "-g" in command.normalized
+    return Task(
+        name=f"Install npm packages: {', '.join(packages)}",
+        module="npm",
+        args={"name": ", ".join(packages), "global": is_global},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+    )
+
+
+def _useradd(match: re.Match[str], command: Command) -> Task:
+    """Translate useradd commands."""
+    username = match.group(1)
+    return Task(
+        name=f"Create user: {username}",
+        module="user",
+        args={"name": username, "state": "present", "create_home": True},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _chown(match: re.Match[str], command: Command) -> Task:
+    """Translate chown commands."""
+    owner, path = match.groups()
+    args: dict[str, Any] = {"path": path}
+    if ":" in owner:
+        user, group = owner.split(":")
+        args["owner"] = user
+        args["group"] = group
+    else:
+        args["owner"] = owner
+    return Task(
+        name=f"Change ownership of {path}",
+        module="file",
+        args=args,
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+def _chmod(match: re.Match[str], command: Command) -> Task:
+    """Translate chmod commands."""
+    mode, path = match.groups()
+    return Task(
+        name=f"Change permissions of {path}",
+        module="file",
+        args={"path": path, "mode": mode},
+        confidence=TaskConfidence.HIGH,
+        original_command=command.raw,
+        become=command.sudo,
+    )
+
+
+Rule = tuple[re.Pattern[str], Callable[[re.Match[str], Command], Task]]
+
+# Rules keyed by program name, so each command is tried against at most one
+# pattern instead of every rule in turn
+RULES: dict[str, Rule] = {
+    "apt": (APT_INSTALL_RE, _apt_install),
+    "apt-get": (APT_INSTALL_RE, _apt_install),
+    "yum": (YUM_INSTALL_RE, _yum_install),
+    "dnf": (DNF_INSTALL_RE, _dnf_install),
+    "systemctl": (SYSTEMCTL_RE, _systemctl),
+    "mkdir": (MKDIR_RE, _mkdir),
+    "cp": (COPY_RE, _copy_file),
+    "git": (GIT_CLONE_RE, _git_clone),
+    "pip": (PIP_INSTALL_RE, _pip_install),
+    "pip3": (PIP_INSTALL_RE, _pip_install),
+    "npm": (NPM_INSTALL_RE, _npm_install),
+    "useradd": (USERADD_RE, _useradd),
+    "chown": (CHOWN_RE, _chown),
+    "chmod": (CHMOD_RE, _chmod),
+}
+
 
 class RulesEngine(TranslatorPort):
     """Translates shell commands to Ansible tasks using rules."""
 
-    def __init__(self) -> None:
-        self.rules = [
-            self._apt_install,
-            self._yum_install,
-            self._dnf_install,
-            self._systemctl,
-            self._mkdir,
-            self._copy_file,
-            self._git_clone,
-            self._pip_install,
-            self._npm_install,
-            self._useradd,
-            self._chown,
-            self._chmod,
-        ]
-
     def translate(self, command: Command) -> Task | None:
         """Translate a command to an Ansible task."""
         cmd = command.normalized.strip()
@@ -34,11 +227,14 @@ class RulesEngine(TranslatorPort):
         if not cmd:
             return None
 
-        # Try each rule
-        for rule in self.rules:
-            task = rule(command)
-            if task:
-                return task
+        # Try the rule for this program, if any
+        head = HEAD_RE.match(command.normalized)
+        rule = RULES.get(head.group()) if head else None
+        if rule:
+            pattern, build = rule
+            match = pattern.match(command.normalized)
+            if match:
+                return build(match, command)
 
         # Fallback to shell module
         return Task(
@@ -49,204 +245,3 @@ class RulesEngine(TranslatorPort):
             original_command=cmd,
             become=command.sudo,
         )
-
-    def _apt_install(self, command: Command) -> Task | None:
-        """Translate apt install commands."""
-        match = re.match(r"apt(?:-get)?\s+install\s+(?:-y\s+)?(.+)", command.normalized)
-        if match:
-            packages = match.group(1).strip().split()
-            return Task(
-                name=f"Install packages: {', '.join(packages)}",
-                module="apt",
-                args={"name": packages, "state": "present", "update_cache": True},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _yum_install(self, command: Command) -> Task | None:
-        """Translate yum install commands."""
-        match = re.match(r"yum\s+install\s+(?:-y\s+)?(.+)", command.normalized)
-        if match:
-            packages = match.group(1).strip().split()
-            return Task(
-                name=f"Install packages: {', '.join(packages)}",
-                module="yum",
-                args={"name": packages, "state": "present"},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _dnf_install(self, command: Command) -> Task | None:
-        """Translate dnf install commands."""
-        match = re.match(r"dnf\s+install\s+(?:-y\s+)?(.+)", command.normalized)
-        if match:
-            packages = match.group(1).strip().split()
-            return Task(
-                name=f"Install packages: {', '.join(packages)}",
-                module="dnf",
-                args={"name": packages, "state": "present"},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _systemctl(self, command: Command) -> Task | None:
-        """Translate systemctl commands."""
-        match = re.match(
-            r"systemctl\s+(start|stop|restart|enable|disable)\s+(\S+)",
-            command.normalized,
-        )
-        if match:
-            action, service = match.groups()
-            state_map = {"start": "started", "stop": "stopped", "restart": "restarted"}
-            if action in state_map:
-                return Task(
-                    name=f"{action.capitalize()} service: {service}",
-                    module="systemd",
-                    args={"name": service, "state": state_map[action]},
-                    confidence=TaskConfidence.HIGH,
-                    original_command=command.raw,
-                    become=command.sudo,
-                )
-            elif action in ["enable", "disable"]:
-                return Task(
-                    name=f"{action.capitalize()} service: {service}",
-                    module="systemd",
-                    args={"name": service, "enabled": action == "enable"},
-                    confidence=TaskConfidence.HIGH,
-                    original_command=command.raw,
-                    become=command.sudo,
-                )
-        return None
-
-    def _mkdir(self, command: Command) -> Task | None:
-        """Translate mkdir commands."""
-        match = re.match(r"mkdir\s+(?:-p\s+)?(.+)", command.normalized)
-        if match:
-            path = match.group(1).strip()
-            return Task(
-                name=f"Create directory: {path}",
-                module="file",
-                args={"path": path, "state": "directory"},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _copy_file(self, command: Command) -> Task | None:
-        """Translate cp commands."""
-        match = re.match(r"cp\s+(?:-r\s+)?(\S+)\s+(\S+)", command.normalized)
-        if match:
-            src, dest = match.groups()
-            return Task(
-                name=f"Copy {src} to {dest}",
-                module="copy",
-                args={"src": src, "dest": dest},
-                confidence=TaskConfidence.MEDIUM,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _git_clone(self, command: Command) -> Task | None:
-        """Translate git clone commands."""
-        match = re.match(r"git\s+clone\s+(\S+)(?:\s+(\S+))?", command.normalized)
-        if match:
-            repo = match.group(1)
-            dest = match.group(2) or repo.split("/")[-1].replace(".git", "")
-            return Task(
-                name=f"Clone repository: {repo}",
-                module="git",
-                args={"repo": repo, "dest": dest},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                creates=dest,
-            )
-        return None
-
-    def _pip_install(self, command: Command) -> Task | None:
-        """Translate pip install commands."""
-        match = re.match(r"pip[3]?\s+install\s+(.+)", command.normalized)
-        if match:
-            packages = match.group(1).strip().split()
-            return Task(
-                name=f"Install Python packages: {', '.join(packages)}",
-                module="pip",
-                args={"name": packages, "state": "present"},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-            )
-        return None
-
-    def _npm_install(self, command: Command) -> Task | None:
-        """Translate npm install commands."""
-        match = re.match(r"npm\s+install\s+(?:-g\s+)?(.+)", command.normalized)
-        if match:
-            packages = match.group(1).strip().split()
-            is_global = "-g" in command.normalized
-            return Task(
-                name=f"Install npm packages: {', '.join(packages)}",
-                module="npm",
-                args={"name": ", ".join(packages), "global": is_global},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-            )
-        return None
-
-    def _useradd(self, command: Command) -> Task | None:
-        """Translate useradd commands."""
-        match = re.match(r"useradd\s+(?:-m\s+)?(\S+)", command.normalized)
-        if match:
-            username = match.group(1)
-            return Task(
-                name=f"Create user: {username}",
-                module="user",
-                args={"name": username, "state": "present", "create_home": True},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _chown(self, command: Command) -> Task | None:
-        """Translate chown commands."""
-        match = re.match(r"chown\s+(?:-R\s+)?(\S+)\s+(.+)", command.normalized)
-        if match:
-            owner, path = match.groups()
-            args: dict[str, Any] = {"path": path}
-            if ":" in owner:
-                user, group = owner.split(":")
-                args["owner"] = user
-                args["group"] = group
-            else:
-                args["owner"] = owner
-            return Task(
-                name=f"Change ownership of {path}",
-                module="file",
-                args=args,
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
-
-    def _chmod(self, command: Command) -> Task | None:
-        """Translate chmod commands."""
-        match = re.match(r"chmod\s+(?:-R\s+)?(\S+)\s+(.+)", command.normalized)
-        if match:
-            mode, path = match.groups()
-            return Task(
-                name=f"Change permissions of {path}",
-                module="file",
-                args={"path": path, "mode": mode},
-                confidence=TaskConfidence.HIGH,
-                original_command=command.raw,
-                become=command.sudo,
-            )
-        return None
@@ -1,35 +1,43 @@
 """Application composition root."""
 
-from cli2ansible.adapters.inbound.http.api import create_app
-from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
-from cli2ansible.adapters.outbound.generators.ansible_role import AnsibleRoleGenerator
-from cli2ansible.adapters.outbound.llm.anthropic_cleaner import AnthropicCleaner
-from cli2ansible.adapters.outbound.llm.openai_cleaner import OpenAICleaner
-from cli2ansible.adapters.outbound.object_store.s3_store import S3ObjectStore
-from cli2ansible.adapters.outbound.translator.rules_engine import RulesEngine
+from typing import TYPE_CHECKING, Any
+
 from cli2ansible.domain.ports import LLMPort
 from cli2ansible.domain.services import CleanSession, CompilePlaybook, IngestSession
-from cli2ansible.settings import settings
+from cli2ansible.settings import get_settings
+
+# Adapters (boto3, SQLAlchemy, httpx, FastAPI) are imported inside the factories
+# so importing this module stays cheap until something is actually built
+if TYPE_CHECKING:
+    from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
+    from cli2ansible.adapters.outbound.object_store.s3_store import S3ObjectStore
+    from fastapi import FastAPI
 
 # Global instances (for dependency injection)
-_repository: SQLAlchemyRepository | None = None
-_object_store: S3ObjectStore | None = None
+_repository: "SQLAlchemyRepository | None" = None
+_object_store: "S3ObjectStore | None" = None
 _llm_cleaner: LLMPort | None = None
+_app: "FastAPI | None" = None
 
 
-def get_repository() -> SQLAlchemyRepository:
+def get_repository() -> "SQLAlchemyRepository":
     """Get or create repository instance."""
     global _repository
     if _repository is None:
-        _repository = SQLAlchemyRepository(settings.database_url)
+        from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
+
+        _repository = SQLAlchemyRepository(get_settings().database_url)
         _repository.create_tables()
     return _repository
 
 
-def get_object_store() -> S3ObjectStore:
+def get_object_store() -> "S3ObjectStore":
     """Get or create object store instance."""
     global _object_store
     if _object_store is None:
+        from cli2ansible.adapters.outbound.object_store.s3_store import S3ObjectStore
+
+        settings = get_settings()
         _object_store = S3ObjectStore(
             endpoint=settings.s3_endpoint,
             access_key=settings.s3_access_key,
@@ -43,15 +51,22 @@ def get_llm_cleaner() -> LLMPort:
     """Get or create LLM cleaner instance based on configured provider."""
     global _llm_cleaner
     if _llm_cleaner is None:
+        settings = get_settings()
         provider = settings.llm_provider.lower()
 
         if provider == "openai":
             if not settings.openai_api_key:
                 raise ValueError("OPENAI_API_KEY not configured")
+            from cli2ansible.adapters.outbound.llm.openai_cleaner import OpenAICleaner
+
             _llm_cleaner = OpenAICleaner(api_key=settings.openai_api_key)
         elif provider == "anthropic":
             if not settings.anthropic_api_key:
                 raise ValueError("ANTHROPIC_API_KEY not configured")
+            from cli2ansible.adapters.outbound.llm.anthropic_cleaner import (
+                AnthropicCleaner,
+            )
+
             _llm_cleaner = AnthropicCleaner(api_key=settings.anthropic_api_key)
         else:
             raise ValueError(
@@ -63,6 +78,11 @@ def get_llm_cleaner() -> LLMPort:
 
 def create_services() -> tuple[IngestSession, CompilePlaybook, CleanSession | None]:
     """Create domain services with dependencies."""
+    from cli2ansible.adapters.outbound.generators.ansible_role import (
+        AnsibleRoleGenerator,
+    )
+    from cli2ansible.adapters.outbound.translator.rules_engine import RulesEngine
+
     repo = get_repository()
     store = get_object_store()
     translator = RulesEngine()
@@ -73,6 +93,7 @@ def create_services() -> tuple[IngestSession, CompilePlaybook, CleanSession | No
 
     # Only create clean service if LLM is configured
     clean_service: CleanSession | None = None
+    settings = get_settings()
     provider = settings.llm_provider.lower()
 
     # Check if appropriate API key is configured
@@ -90,12 +111,25 @@ def create_services() -> tuple[IngestSession, CompilePlaybook, CleanSession | No
     return ingest_service, compile_service, clean_service
 
 
-# Create FastAPI app
-ingest_service, compile_service, clean_service = create_services()
-app = create_app(ingest_service, compile_service, clean_service)
+def get_asgi_app() -> "FastAPI":
+    """Get or create the FastAPI app, wiring services on first use."""
+    global _app
+    if _app is None:
+        from cli2ansible.adapters.inbound.http.api import create_app
+
+        _app = create_app(*create_services())
+    return _app
+
+
+def __getattr__(name: str) -> Any:
+    # Build the app only when it is first looked up (e.g. by
+    # `uvicorn cli2ansible.app:app`), not when this module is imported
+    if name == "app":
+        return get_asgi_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(get_asgi_app(), host="0.0.0.0", port=8000)
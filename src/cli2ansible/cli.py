@@ -1,10 +1,41 @@
 """Command-line interface for cli2ansible utilities."""
 
-import json
 import sys
-from pathlib import Path
+from collections.abc import Iterable
+from typing import TextIO
 
+import orjson
 from cli2ansible.adapters.outbound.capture.asciinema_parser import parse_cast_file
+from cli2ansible.domain.models import Event
+
+
+def write_events_json(events: Iterable[Event], out: TextIO) -> int:
+    """
+    Write events to a text stream as a pretty-printed JSON array.
+
+    Events are encoded with orjson and written one at a time, so the full
+    document is never built in memory.
+
+    Returns:
+        Number of events written
+    """
+    count = 0
+    for event in events:
+        item = orjson.dumps(
+            {
+                "timestamp": event.timestamp,
+                "event_type": event.event_type,
+                "data": event.data,
+                "sequence": event.sequence,
+            },
+            option=orjson.OPT_INDENT_2,
+        ).decode()
+        out.write(",\n  " if count else "[\n  ")
+        # Nest the object one level inside the array
+        out.write(item.replace("\n", "\n  "))
+        count += 1
+    out.write("\n]\n" if count else "[]\n")
+    return count
 
 
 def convert_cast_to_json(cast_file: str, output_file: str | None = None) -> None:
@@ -22,26 +53,13 @@ def convert_cast_to_json(cast_file: str, output_file: str | None = None) -> None
     # Parse the cast file
     events = parse_cast_file(cast_file)
 
-    # Convert events to JSON-serializable dicts
-    events_json = [
-        {
-            "timestamp": event.timestamp,
-            "event_type": event.event_type,
-            "data": event.data,
-            "sequence": event.sequence,
-        }
-        for event in events
-    ]
-
-    # Format as pretty JSON
-    json_output = json.dumps(events_json, indent=2, ensure_ascii=False)
-
-    # Write to file or stdout
+    # Stream pretty JSON to file or stdout
     if output_file:
-        Path(output_file).write_text(json_output + "\n", encoding="utf-8")
-        print(f"Converted {len(events)} events to {output_file}", file=sys.stderr)
+        with open(output_file, "w", encoding="utf-8") as f:
+            count = write_events_json(events, f)
+        print(f"Converted {count} events to {output_file}", file=sys.stderr)
     else:
-        print(json_output)
+        write_events_json(events, sys.stdout)
 
 
 def main() -> None:
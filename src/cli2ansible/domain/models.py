@@ -26,19 +26,21 @@ class TaskConfidence(str, Enum):
     LOW = "low"  # Fallback shell task
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Session:
     """Terminal session recording."""
 
     id: UUID = field(default_factory=uuid4)
     name: str = ""
     status: SessionStatus = SessionStatus.CREATED
+    # Each default reads the clock separately; pass one shared timestamp for
+    # both when constructing sessions in bulk
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Event:
     """Terminal event from recording."""
 
@@ -49,7 +51,7 @@ class Event:
     sequence: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Command:
     """Parsed command from terminal session."""
 
@@ -64,7 +66,7 @@ class Command:
     output: str = ""
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """Ansible task representation."""
 
@@ -80,7 +82,7 @@ class Task:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Role:
     """Ansible role structure."""
 
@@ -92,7 +94,7 @@ class Role:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Report:
     """Translation report with statistics and warnings."""
 
@@ -106,7 +108,7 @@ class Report:
     generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CleanedCommand:
     """A command that has been cleaned and deduplicated."""
 
@@ -119,7 +121,7 @@ class CleanedCommand:
     is_error_correction: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class CleaningReport:
     """Report of terminal session cleaning."""
 
@@ -1,6 +1,8 @@
 """Port interfaces (hexagonal architecture)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import BinaryIO
 from uuid import UUID
 
 from cli2ansible.domain.models import (
@@ -10,6 +12,7 @@ from cli2ansible.domain.models import (
     Event,
     Role,
     Session,
+    SessionStatus,
     Task,
 )
 
@@ -18,8 +21,10 @@ class CapturePort(ABC):
     """Port for parsing terminal recordings."""
 
     @abstractmethod
-    def parse_events(self, recording_data: bytes) -> list[Event]:
-        """Parse recording into events."""
+    def parse_events(
+        self, recording_data: bytes, *, session_id: UUID | None = None
+    ) -> list[Event]:
+        """Parse recording into events, stamped with session_id if given."""
         ...
 
 
@@ -31,6 +36,15 @@ class TranslatorPort(ABC):
         """Translate a command to an Ansible task."""
         ...
 
+    def translate_many(self, commands: list[Command]) -> list[Task | None]:
+        """
+        Translate commands in order; result i corresponds to commands[i].
+
+        Translators with a cheaper batch path should override this default.
+        """
+        translate = self.translate
+        return [translate(command) for command in commands]
+
 
 class RoleGeneratorPort(ABC):
     """Port for generating Ansible role artifacts."""
@@ -59,6 +73,11 @@ class SessionRepositoryPort(ABC):
         """Update session."""
         ...
 
+    @abstractmethod
+    def update_status(self, session_id: UUID, status: SessionStatus) -> bool:
+        """Set a session's status; returns False if the session does not exist."""
+        ...
+
     @abstractmethod
     def save_events(self, events: list[Event]) -> None:
         """Save events for a session."""
@@ -74,6 +93,11 @@ class SessionRepositoryPort(ABC):
         """Save parsed commands."""
         ...
 
+    @abstractmethod
+    def replace_commands(self, session_id: UUID, commands: list[Command]) -> None:
+        """Replace all stored commands of a session with the given ones."""
+        ...
+
     @abstractmethod
     def get_commands(self, session_id: UUID) -> list[Command]:
         """Get all commands for a session."""
@@ -85,9 +109,12 @@ class ObjectStorePort(ABC):
 
     @abstractmethod
     def upload(
-        self, key: str, data: bytes, content_type: str = "application/octet-stream"
+        self,
+        key: str,
+        data: bytes | BinaryIO,
+        content_type: str = "application/octet-stream",
     ) -> str:
-        """Upload artifact and return URL."""
+        """Upload artifact (bytes or a readable binary file) and return URL."""
         ...
 
     @abstractmethod
@@ -95,6 +122,15 @@ class ObjectStorePort(ABC):
         """Download artifact."""
         ...
 
+    def stream(self, key: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Download artifact as an iterator of chunks.
+
+        Lookup errors are raised when called, not on first iteration.
+        Stores that can stream should override the single-chunk default.
+        """
+        return iter([self.download(key)])
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """Delete artifact."""
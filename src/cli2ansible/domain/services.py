@@ -1,7 +1,11 @@
 """Domain services (business logic)."""
 
+import copy
 import re
-from typing import Any
+import threading
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any, BinaryIO, cast
 from uuid import UUID
 
 from cli2ansible.domain.models import (
@@ -24,6 +28,23 @@ from cli2ansible.domain.ports import (
     TranslatorPort,
 )
 
+# CSI escape sequences (colours, cursor movement, erase line, ...)
+_ANSI_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
+# Role archives up to this size are built in memory instead of a temp file
+_ARTIFACT_SPOOL_SIZE = 2 * 1024 * 1024
+
+# Maximum number of sessions whose compiled role/report are kept in memory
+_COMPILE_CACHE_SIZE = 128
+
+# Maximum number of sessions whose LLM cleaning results are kept in memory
+_CLEAN_CACHE_SIZE = 128
+
+# Cache keys: the session name plus (normalized, sudo) per command for compiling,
+# and (raw, timestamp) per command for cleaning
+_CompileKey = tuple[str, tuple[tuple[str, bool], ...]]
+_CleanKey = tuple[tuple[str, float], ...]
+
 
 class IngestSession:
     """Service for ingesting terminal sessions."""
@@ -35,17 +56,16 @@ class IngestSession:
         self, name: str, metadata: dict[str, Any] | None = None
     ) -> Session:
         """Create a new session."""
-        session = Session(name=name, metadata=metadata or {})
+        now = datetime.now(UTC)
+        session = Session(
+            name=name, metadata=metadata or {}, created_at=now, updated_at=now
+        )
         return self.repo.create(session)
 
     def save_events(self, session_id: UUID, events: list[Event]) -> None:
         """Save events for a session."""
-        session = self.repo.get(session_id)
-        if not session:
+        if not self.repo.update_status(session_id, SessionStatus.UPLOADED):
             raise ValueError(f"Session {session_id} not found")
-
-        session.status = SessionStatus.UPLOADED
-        self.repo.update(session)
         self.repo.save_events(events)
 
     def extract_commands(self, session_id: UUID) -> list[Command]:
@@ -53,38 +73,49 @@ class IngestSession:
         events = self.repo.get_events(session_id)
         commands: list[Command] = []
 
-        current_line = ""
+        # Pending text is kept as a list of chunks and joined only when it is
+        # split or parsed, so a long carriage-return-only run stays linear
+        parts: list[str] = []
+        pending_cr = False
         for event in events:
             if event.event_type == "o":  # Output
-                current_line += event.data
+                data = event.data
+                parts.append(data)
+                has_newline = "\n" in data
+                pending_cr = pending_cr or "\r" in data
                 # Process lines if we have newlines OR if this is a new event without continuation
-                if "\n" in current_line or "\r" in current_line:
-                    lines = current_line.split("\n")
-                    for line in lines[:-1]:
-                        cmd = self._parse_command_line(
-                            line, session_id, event.timestamp
-                        )
+                if has_newline:
+                    buffer = "".join(parts)
+                    cut = buffer.rfind("\n")
+                    # Escape sequences never span lines, so strip every
+                    # completed line in one call instead of one call per line
+                    for line in _ANSI_RE.sub("", buffer[:cut]).split("\n"):
+                        cmd = self._command_from_line(line, session_id, event.timestamp)
                         if cmd:
                             commands.append(cmd)
-                    current_line = lines[-1]
-                else:
+                    tail = buffer[cut + 1 :]
+                    parts = [tail] if tail else []
+                    pending_cr = "\r" in tail
+                elif not pending_cr:
                     # If there's no newline, treat each event as a potential command
                     cmd = self._parse_command_line(
-                        current_line, session_id, event.timestamp
+                        "".join(parts), session_id, event.timestamp
                     )
                     if cmd:
                         commands.append(cmd)
-                    current_line = ""
+                    parts = []
 
         # Process any remaining line
-        if current_line:
+        if parts:
             cmd = self._parse_command_line(
-                current_line, session_id, events[-1].timestamp if events else 0.0
+                "".join(parts), session_id, events[-1].timestamp if events else 0.0
             )
             if cmd:
                 commands.append(cmd)
 
-        self.repo.save_commands(commands)
+        # Commands are derived from all of the session's events, so they replace
+        # any earlier extraction instead of being appended a second time
+        self.repo.replace_commands(session_id, commands)
         return commands
 
     def _parse_command_line(
@@ -92,11 +123,16 @@ class IngestSession:
     ) -> Command | None:
         """Parse a line to extract command."""
         # Remove ANSI escape codes
-        line = re.sub(r"\x1b\[[0-9;]*m", "", line)
+        return self._command_from_line(_ANSI_RE.sub("", line), session_id, timestamp)
+
+    def _command_from_line(
+        self, line: str, session_id: UUID, timestamp: float
+    ) -> Command | None:
+        """Build a command from a line already stripped of ANSI escapes."""
         line = line.strip()
 
         # Skip empty lines and prompts
-        if not line or line.endswith("$") or line.endswith("#"):
+        if not line or line[-1] in "$#":
             return None
 
         # Detect sudo
@@ -127,42 +163,82 @@ class CompilePlaybook:
         self.translator = translator
         self.generator = generator
         self.store = store
+        # session_id -> (session name and commands version, role, report)
+        self._compile_cache: OrderedDict[UUID, tuple[_CompileKey, Role, Report]] = (
+            OrderedDict()
+        )
+        # compile runs in the API threadpool
+        self._compile_cache_lock = threading.Lock()
 
     def compile(self, session_id: UUID) -> tuple[Role, Report]:
-        """Compile session commands into an Ansible role."""
+        """
+        Compile session commands into an Ansible role.
+
+        Results are cached per session and reused until the session's name
+        or commands change, so a report request following a compile does not
+        translate every command again. Callers always get their own copy.
+        """
         session = self.repo.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
-        session.status = SessionStatus.COMPILING
-        self.repo.update(session)
-
         commands = self.repo.get_commands(session_id)
+        # The name becomes the role name, so it is part of the key. The tuple is
+        # stored and compared in full; a bare hash() could collide
+        version = (session.name, tuple((cmd.normalized, cmd.sudo) for cmd in commands))
+        with self._compile_cache_lock:
+            cached = self._compile_cache.get(session_id)
+            if cached is not None and cached[0] == version:
+                self._compile_cache.move_to_end(session_id)
+            else:
+                cached = None
+        if cached is not None:
+            # Nothing is re-translated, but the session still ends up compiled
+            self.repo.update_status(session_id, SessionStatus.COMPLETED)
+            return copy.deepcopy((cached[1], cached[2]))
+
+        self.repo.update_status(session_id, SessionStatus.COMPILING)
+
         tasks: list[Task] = []
         report = Report(session_id=session_id, total_commands=len(commands))
 
-        for command in commands:
-            task = self.translator.translate(command)
+        # Enum members are singletons; bind them once and compare by identity
+        high, medium = TaskConfidence.HIGH, TaskConfidence.MEDIUM
+        high_count = medium_count = low_count = 0
+        append_task = tasks.append
+        for command, task in zip(
+            commands, self.translator.translate_many(commands), strict=True
+        ):
             if task:
-                tasks.append(task)
-                if task.confidence == TaskConfidence.HIGH:
-                    report.high_confidence += 1
-                elif task.confidence == TaskConfidence.MEDIUM:
-                    report.medium_confidence += 1
+                append_task(task)
+                confidence = task.confidence
+                if confidence is high:
+                    high_count += 1
+                elif confidence is medium:
+                    medium_count += 1
                 else:
-                    report.low_confidence += 1
+                    low_count += 1
             else:
                 report.skipped_commands.append(command.raw)
+        report.high_confidence = high_count
+        report.medium_confidence = medium_count
+        report.low_confidence = low_count
 
         role = Role(name=session.name or f"role_{session_id}", tasks=tasks)
 
-        session.status = SessionStatus.COMPLETED
-        self.repo.update(session)
+        self.repo.update_status(session_id, SessionStatus.COMPLETED)
 
-        return role, report
+        with self._compile_cache_lock:
+            self._compile_cache[session_id] = (version, role, report)
+            self._compile_cache.move_to_end(session_id)
+            if len(self._compile_cache) > _COMPILE_CACHE_SIZE:
+                self._compile_cache.popitem(last=False)
+
+        return copy.deepcopy((role, report))
 
     def export_artifact(self, role: Role, session_id: UUID) -> str:
         """Generate and upload role artifact."""
+        import os
         import tempfile
         import zipfile
         from pathlib import Path
@@ -173,19 +249,25 @@ class CompilePlaybook:
 
             self.generator.generate(role, str(role_path))
 
-            # Zip the role
-            zip_path = Path(tmpdir) / f"{role.name}.zip"
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file in role_path.rglob("*"):
-                    if file.is_file():
-                        zipf.write(file, file.relative_to(role_path.parent))
-
-            with open(zip_path, "rb") as f:
-                artifact_data = f.read()
-
-            key = f"sessions/{session_id}/role.zip"
-            result: str = self.store.upload(key, artifact_data, "application/zip")
-            return result
+            # Small roles are zipped in memory; larger ones spill to disk. The
+            # archive is then streamed to the store rather than read back whole
+            with tempfile.SpooledTemporaryFile(_ARTIFACT_SPOOL_SIZE) as spool:
+                # Level 1 is much faster than the default 6 and role YAML still
+                # compresses well; os.walk avoids a stat per entry from rglob
+                with zipfile.ZipFile(
+                    spool, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+                ) as zipf:
+                    for root, _, files in os.walk(role_path):
+                        for name in files:
+                            full = os.path.join(root, name)
+                            zipf.write(full, os.path.relpath(full, tmpdir))
+                spool.seek(0)
+
+                key = f"sessions/{session_id}/role.zip"
+                result: str = self.store.upload(
+                    key, cast(BinaryIO, spool), "application/zip"
+                )
+                return result
 
 
 class CleanSession:
@@ -194,6 +276,12 @@ class CleanSession:
     def __init__(self, repo: SessionRepositoryPort, llm: LLMPort) -> None:
         self.repo = repo
         self.llm = llm
+        # session_id -> (commands version, cleaned commands, report)
+        self._clean_cache: OrderedDict[
+            UUID, tuple[_CleanKey, list[CleanedCommand], CleaningReport]
+        ] = OrderedDict()
+        # clean_commands runs in the API threadpool
+        self._clean_cache_lock = threading.Lock()
 
     def clean_commands(
         self, session_id: UUID
@@ -205,6 +293,9 @@ class CleanSession:
         - Duplicate commands that were run multiple times
         - Error corrections where user fixed typos or mistakes
         - Redundant commands that don't add value
+
+        Results are cached per session until its commands change, so repeat
+        calls do not make another LLM round-trip.
         """
         commands = self.repo.get_commands(session_id)
         if not commands:
@@ -217,8 +308,22 @@ class CleanSession:
                 cleaning_rationale="No commands found in session",
             )
 
+        version = tuple((cmd.raw, cmd.timestamp) for cmd in commands)
+        with self._clean_cache_lock:
+            cached = self._clean_cache.get(session_id)
+            if cached is not None and cached[0] == version:
+                self._clean_cache.move_to_end(session_id)
+                # Callers get their own copy so they cannot mutate the cache
+                return copy.deepcopy((cached[1], cached[2]))
+
         cleaned_commands, report = self.llm.clean_commands(commands, session_id)
-        return cleaned_commands, report
+
+        with self._clean_cache_lock:
+            self._clean_cache[session_id] = (version, cleaned_commands, report)
+            self._clean_cache.move_to_end(session_id)
+            if len(self._clean_cache) > _CLEAN_CACHE_SIZE:
+                self._clean_cache.popitem(last=False)
+        return copy.deepcopy((cleaned_commands, report))
 
     def get_essential_commands(self, session_id: UUID) -> list[str]:
         """Get the essential commands needed to reproduce the session."""
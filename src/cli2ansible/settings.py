@@ -1,5 +1,6 @@
 """Application settings using Pydantic."""
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -37,5 +38,11 @@ class Settings(BaseSettings):
 
     max_commands_for_cleaning: int = Field(default=500)
 
+    # Maximum request body size for event uploads (bytes)
+    max_upload_size: int = Field(default=10 * 1024 * 1024)
 
-settings = Settings()
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings on first use; call get_settings.cache_clear() to reload."""
+    return Settings()
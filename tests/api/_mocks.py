@@ -0,0 +1,83 @@
+"""Test doubles shared by the API tests."""
+
+from typing import BinaryIO
+
+from cli2ansible.domain.models import CleanedCommand, CleaningReport, Command
+from cli2ansible.domain.ports import LLMPort, ObjectStorePort
+
+
+class MockObjectStore(ObjectStorePort):
+    """Mock object store for testing."""
+
+    def __init__(self) -> None:
+        self.storage: dict[str, bytes] = {}
+
+    def upload(
+        self,
+        key: str,
+        data: bytes | BinaryIO,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        self.storage[key] = data if isinstance(data, bytes) else data.read()
+        return key
+
+    def download(self, key: str) -> bytes:
+        return self.storage.get(key, b"")
+
+    def delete(self, key: str) -> None:
+        if key in self.storage:
+            del self.storage[key]
+
+    def generate_url(self, key: str, expires_in: int = 3600) -> str:
+        return f"http://mock/{key}"
+
+
+class MockLLMPort(LLMPort):
+    """Mock LLM port for testing."""
+
+    def clean_commands(
+        self, commands: list[Command], session_id: object
+    ) -> tuple[list[CleanedCommand], CleaningReport]:
+        """Mock implementation of clean_commands."""
+        if not commands:
+            return [], CleaningReport(
+                session_id=session_id,
+                original_command_count=0,
+                cleaned_command_count=0,
+                duplicates_removed=0,
+                error_corrections_removed=0,
+                cleaning_rationale="No commands",
+            )
+
+        # Return a simplified version (remove duplicates)
+        seen = set()
+        cleaned = []
+        duplicates = 0
+
+        for cmd in commands:
+            if cmd.normalized not in seen:
+                seen.add(cmd.normalized)
+                cleaned.append(
+                    CleanedCommand(
+                        session_id=session_id,
+                        command=cmd.normalized,
+                        reason="Essential command",
+                        first_occurrence=cmd.timestamp,
+                        occurrence_count=1,
+                        is_duplicate=False,
+                        is_error_correction=False,
+                    )
+                )
+            else:
+                duplicates += 1
+
+        report = CleaningReport(
+            session_id=session_id,
+            original_command_count=len(commands),
+            cleaned_command_count=len(cleaned),
+            duplicates_removed=duplicates,
+            error_corrections_removed=0,
+            cleaning_rationale=f"Removed {duplicates} duplicate commands",
+        )
+
+        return cleaned, report
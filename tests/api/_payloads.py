@@ -0,0 +1,11 @@
+"""Event payloads shared by the API tests."""
+
+# One apt-get install, compiled to a single high-confidence task
+APT_NGINX_EVENTS = [
+    {
+        "timestamp": 1.0,
+        "event_type": "o",
+        "data": "apt-get install nginx\n",
+        "sequence": 0,
+    },
+]
@@ -1,50 +1,54 @@
 """Shared test fixtures for API tests."""
 
+from collections.abc import Iterator
+
 import pytest
 from cli2ansible.adapters.inbound.http.api import create_app
 from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
 from cli2ansible.adapters.outbound.generators.ansible_role import AnsibleRoleGenerator
 from cli2ansible.adapters.outbound.translator.rules_engine import RulesEngine
-from cli2ansible.domain.ports import ObjectStorePort
-from cli2ansible.domain.services import CompilePlaybook, IngestSession
+from cli2ansible.domain.services import CleanSession, CompilePlaybook, IngestSession
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from tests.api._mocks import MockLLMPort, MockObjectStore
 
-class MockObjectStore(ObjectStorePort):
-    """Mock object store for testing."""
-
-    def __init__(self) -> None:
-        self.storage: dict[str, bytes] = {}
 
-    def upload(
-        self, key: str, data: bytes, content_type: str = "application/octet-stream"
-    ) -> str:
-        self.storage[key] = data
+@pytest.fixture(scope="session")
+def app(repository: SQLAlchemyRepository) -> FastAPI:
+    """Create the FastAPI app, with a mock-LLM clean service, shared by the session."""
+    store = MockObjectStore()
+    translator = RulesEngine()
+    generator = AnsibleRoleGenerator()
 
-        return key
+    ingest = IngestSession(repository)
+    compile_svc = CompilePlaybook(repository, translator, generator, store)
+    clean_svc = CleanSession(repository, MockLLMPort())
 
-    def download(self, key: str) -> bytes:
-        return self.storage.get(key, b"")
+    app = create_app(ingest, compile_svc, clean_svc)
+    app.state.store = store
+    return app
 
-    def delete(self, key: str) -> None:
-        if key in self.storage:
-            del self.storage[key]
 
-    def generate_url(self, key: str, expires_in: int = 3600) -> str:
-        return f"http://mock/{key}"
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """Create test client shared by the whole test session."""
+    # Entered once, so the app's startup/shutdown run once per session
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture()
-def client() -> TestClient:
-    """Create test client."""
-    repo = SQLAlchemyRepository("sqlite:///:memory:")
-    repo.create_tables()
-    store = MockObjectStore()
-    translator = RulesEngine()
-    generator = AnsibleRoleGenerator()
+@pytest.fixture(autouse=True)
+def _reset_store(request: pytest.FixtureRequest) -> None:
+    """Empty the shared app's object store before each test that uses it."""
+    # Tables are emptied by the root conftest's _clean_tables fixture
+    if "app" not in request.fixturenames:
+        return
+    request.getfixturevalue("app").state.store.storage.clear()
 
-    ingest = IngestSession(repo)
-    compile_svc = CompilePlaybook(repo, translator, generator, store)
 
-    app = create_app(ingest, compile_svc)
-    return TestClient(app)
+@pytest.fixture()
+def fresh_session_id(client: TestClient) -> str:
+    """Id of a new session for tests that modify it."""
+    response = client.post("/sessions", json={"name": "test-session", "metadata": {}})
+    return str(response.json()["id"])
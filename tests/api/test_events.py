@@ -1,15 +1,15 @@
 """Events endpoint tests."""
 
+from collections.abc import Iterator
+
+import pytest
+from cli2ansible.settings import get_settings
 from fastapi.testclient import TestClient
 
 
-def test_upload_events(client: TestClient) -> None:
+def test_upload_events(client: TestClient, fresh_session_id: str) -> None:
     """Test uploading events."""
-    # Create session
-    create_resp = client.post(
-        "/sessions", json={"name": "test-session", "metadata": {}}
-    )
-    session_id = create_resp.json()["id"]
+    session_id = fresh_session_id
 
     # Upload events
     events = [
@@ -18,3 +18,46 @@ def test_upload_events(client: TestClient) -> None:
     response = client.post(f"/sessions/{session_id}/events", json=events)
     assert response.status_code == 200
     assert response.json()["status"] == "uploaded"
+
+
+def test_upload_events_invalid_payload(
+    client: TestClient, fresh_session_id: str
+) -> None:
+    """Test uploading malformed events returns a validation error."""
+    session_id = fresh_session_id
+
+    events = [{"timestamp": 1.0, "event_type": "o" * 11, "data": "echo hello\n"}]
+    response = client.post(f"/sessions/{session_id}/events", json=events)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 0, "event_type"]
+
+
+def test_upload_events_too_large(
+    client: TestClient, fresh_session_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test uploads over the configured size limit are rejected with 413."""
+    monkeypatch.setattr(get_settings(), "max_upload_size", 64)
+    session_id = fresh_session_id
+
+    events = [{"timestamp": 1.0, "event_type": "o", "data": "x" * 100}]
+    response = client.post(f"/sessions/{session_id}/events", json=events)
+
+    assert response.status_code == 413
+
+
+def test_upload_events_too_large_without_content_length(
+    client: TestClient, fresh_session_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test chunked uploads are rejected with 413 once they pass the limit."""
+    monkeypatch.setattr(get_settings(), "max_upload_size", 64)
+    session_id = fresh_session_id
+
+    def chunks() -> Iterator[bytes]:
+        yield b'[{"timestamp": 1.0, "event_type": "o", "data": "'
+        yield b"x" * 100
+        yield b'"}]'
+
+    response = client.post(f"/sessions/{session_id}/events", content=chunks())
+
+    assert response.status_code == 413
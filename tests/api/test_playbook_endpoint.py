@@ -0,0 +1,25 @@
+"""Playbook download endpoint tests."""
+
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+
+def test_download_playbook(client: TestClient, fresh_session_id: str) -> None:
+    """Test downloading the compiled role artifact."""
+    session_id = fresh_session_id
+
+    events = [
+        {"timestamp": 1.0, "event_type": "o", "data": "mkdir /opt/app\n", "sequence": 0}
+    ]
+    client.post(f"/sessions/{session_id}/events", json=events)
+    client.post(f"/sessions/{session_id}/compile", json={})
+
+    response = client.get(f"/sessions/{session_id}/playbook")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert f"role_{session_id}.zip" in response.headers["content-disposition"]
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert "test-session/tasks/main.yml" in archive.namelist()
@@ -0,0 +1,73 @@
+"""Report endpoint tests."""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from tests.api._payloads import APT_NGINX_EVENTS
+
+
+def test_get_report(client: TestClient, fresh_session_id: str) -> None:
+    """Test getting the translation report for a session."""
+    session_id = fresh_session_id
+    client.post(f"/sessions/{session_id}/events", json=APT_NGINX_EVENTS)
+    client.post(f"/sessions/{session_id}/compile", json={})
+
+    response = client.get(f"/sessions/{session_id}/report")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["session_id"] == session_id
+    assert data["total_commands"] == 1
+    assert data["high_confidence"] == 1
+    assert data["skipped_commands"] == []
+    assert "generated_at" in data
+
+
+def test_get_report_not_found(client: TestClient) -> None:
+    """Test getting a report for a non-existent session returns 404."""
+    response = client.get(f"/sessions/{uuid4()}/report")
+
+    assert response.status_code == 404
+
+
+def test_get_report_not_modified(client: TestClient, fresh_session_id: str) -> None:
+    """Test a matching If-None-Match returns 304 until the report changes."""
+    session_id = fresh_session_id
+    client.post(f"/sessions/{session_id}/compile", json={})
+
+    first = client.get(f"/sessions/{session_id}/report")
+    etag = first.headers["etag"]
+
+    response = client.get(
+        f"/sessions/{session_id}/report", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_get_report_not_modified_weak_etag_list(
+    client: TestClient, fresh_session_id: str
+) -> None:
+    """Test If-None-Match matches weak ETags inside a comma-separated list."""
+    session_id = fresh_session_id
+    client.post(f"/sessions/{session_id}/compile", json={})
+    etag = client.get(f"/sessions/{session_id}/report").headers["etag"]
+
+    listed = client.get(
+        f"/sessions/{session_id}/report",
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+    wildcard = client.get(
+        f"/sessions/{session_id}/report", headers={"If-None-Match": "*"}
+    )
+    mismatch = client.get(
+        f"/sessions/{session_id}/report", headers={"If-None-Match": '"other"'}
+    )
+
+    assert listed.status_code == 304
+    assert wildcard.status_code == 304
+    assert mismatch.status_code == 200
@@ -7,4 +7,5 @@ def test_root_endpoint(client: TestClient) -> None:
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
-    assert response.json()["status"] == "ok"
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok", "service": "cli2ansible"}
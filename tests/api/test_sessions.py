@@ -1,5 +1,8 @@
 """Session endpoint tests."""
 
+from datetime import datetime
+from uuid import UUID
+
 from fastapi.testclient import TestClient
 
 
@@ -12,15 +15,20 @@ def test_create_session(client: TestClient) -> None:
     assert "id" in data
 
 
-def test_get_session(client: TestClient) -> None:
+def test_get_session(client: TestClient, fresh_session_id: str) -> None:
     """Test getting a session."""
-    # Create session
-    create_resp = client.post(
-        "/sessions", json={"name": "test-session", "metadata": {}}
-    )
-    session_id = create_resp.json()["id"]
-
-    # Get session
-    response = client.get(f"/sessions/{session_id}")
+    response = client.get(f"/sessions/{fresh_session_id}")
     assert response.status_code == 200
-    assert response.json()["id"] == session_id
+    assert response.json()["id"] == fresh_session_id
+
+
+def test_session_response_serialization(client: TestClient) -> None:
+    """Test session responses serialize UUIDs and datetimes as JSON strings."""
+    response = client.post(
+        "/sessions", json={"name": "test-session", "metadata": {"key": "value"}}
+    )
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert str(UUID(data["id"])) == data["id"]
+    assert datetime.fromisoformat(data["created_at"])
+    assert data["metadata"] == {"key": "value"}
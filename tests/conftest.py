@@ -1,26 +1,38 @@
 """Pytest fixtures."""
 
 import pytest
+from cli2ansible.adapters.outbound.db.orm import Base
 from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
 from cli2ansible.adapters.outbound.generators.ansible_role import AnsibleRoleGenerator
 from cli2ansible.adapters.outbound.translator.rules_engine import RulesEngine
 from cli2ansible.domain.services import IngestSession
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def in_memory_db() -> str:
     """In-memory SQLite database URL."""
     return "sqlite:///:memory:"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def repository(in_memory_db: str) -> SQLAlchemyRepository:
-    """Create repository with in-memory database."""
+    """Create repository with in-memory database, shared by the whole session."""
     repo = SQLAlchemyRepository(in_memory_db)
     repo.create_tables()
     return repo
 
 
+@pytest.fixture(autouse=True)
+def _clean_tables(request: pytest.FixtureRequest) -> None:
+    """Empty the shared repository's tables before each test that uses it."""
+    if "repository" not in request.fixturenames:
+        return
+    repository = request.getfixturevalue("repository")
+    with repository.engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
 @pytest.fixture()
 def translator() -> RulesEngine:
     """Create translator."""
@@ -0,0 +1,24 @@
+"""Shared fixtures for integration tests."""
+
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+from cli2ansible.adapters.outbound.capture.asciinema_parser import parse_cast_file
+from cli2ansible.domain.models import Event
+
+DEMO_CAST_PATH = Path(__file__).parent.parent / "fixtures" / "demo.cast"
+
+
+@pytest.fixture(scope="session")
+def demo_cast_events() -> list[Event]:
+    """Events parsed once from the demo.cast fixture."""
+    assert DEMO_CAST_PATH.exists(), f"Fixture not found: {DEMO_CAST_PATH}"
+    return parse_cast_file(str(DEMO_CAST_PATH))
+
+
+@pytest.fixture(scope="session")
+def demo_cast_events_custom_sid() -> tuple[UUID, list[Event]]:
+    """A custom session_id and the demo.cast events parsed with it."""
+    session_id = uuid4()
+    return session_id, parse_cast_file(str(DEMO_CAST_PATH), session_id=session_id)
@@ -1,30 +1,20 @@
 """Integration tests for asciinema parser with real fixtures."""
 
-from pathlib import Path
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from cli2ansible.adapters.outbound.capture.asciinema_parser import parse_cast_file
+from cli2ansible.domain.models import Event
 
 
 class TestAsciinemaIntegration:
     """Integration tests using real demo.cast fixture."""
 
-    def test_parse_demo_cast_fixture(self) -> None:
+    def test_parse_demo_cast_fixture(self, demo_cast_events: list[Event]) -> None:
         """Test end-to-end parsing of demo.cast fixture."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-        assert fixture_path.exists(), f"Fixture not found: {fixture_path}"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert - verify structure
         assert len(events) > 0, "Should parse at least one event"
-        assert all(hasattr(e, "session_id") for e in events), "All events should have session_id"
-        assert all(hasattr(e, "timestamp") for e in events), "All events should have timestamp"
-        assert all(hasattr(e, "event_type") for e in events), "All events should have event_type"
-        assert all(hasattr(e, "data") for e in events), "All events should have data"
-        assert all(hasattr(e, "sequence") for e in events), "All events should have sequence"
+        assert all(isinstance(e, Event) for e in events), "All events should be Event instances"
 
         # Verify all events share same session_id
         session_ids = {e.session_id for e in events}
@@ -32,33 +22,25 @@ class TestAsciinemaIntegration:
         assert isinstance(list(session_ids)[0], UUID), "session_id should be UUID"
 
         # Verify sequences are sequential
-        sequences = [e.sequence for e in events]
-        assert sequences == list(range(len(events))), "Sequences should be 0, 1, 2, ..."
+        assert all(e.sequence == i for i, e in enumerate(events)), "Sequences should be 0, 1, 2, ..."
 
         # Verify event types - new parser only returns "o" (output) events with commands
         event_types = {e.event_type for e in events}
         assert event_types == {"o"}, "Parser should only return output events with commands"
 
-    def test_parse_demo_cast_with_session_override(self) -> None:
+    def test_parse_demo_cast_with_session_override(
+        self, demo_cast_events_custom_sid: tuple[UUID, list[Event]]
+    ) -> None:
         """Test parsing demo.cast with custom session_id."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-        custom_session_id = uuid4()
-
-        # Act
-        events = parse_cast_file(str(fixture_path), session_id=custom_session_id)
+        custom_session_id, events = demo_cast_events_custom_sid
 
         # Assert
         assert len(events) > 0
         assert all(e.session_id == custom_session_id for e in events)
 
-    def test_parse_demo_cast_event_types(self) -> None:
+    def test_parse_demo_cast_event_types(self, demo_cast_events: list[Event]) -> None:
         """Test demo.cast contains expected commands."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert - new parser extracts commands from OSC sequences
         # All events should be output events containing commands
@@ -71,13 +53,9 @@ class TestAsciinemaIntegration:
         assert "echo \"Hello Phillip\"" in commands, "Should have echo command"
         assert "exit" in commands, "Should have exit command"
 
-    def test_parse_demo_cast_commands(self) -> None:
+    def test_parse_demo_cast_commands(self, demo_cast_events: list[Event]) -> None:
         """Test demo.cast contains expected commands from fixture."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert - verify specific commands from demo.cast OSC sequences
         commands = [e.data for e in events]
@@ -90,13 +68,9 @@ class TestAsciinemaIntegration:
         assert "Hello Phillip" in command_str, "Should contain echo output"
         assert "exit" in command_str, "Should contain exit command"
 
-    def test_parse_demo_cast_output(self) -> None:
+    def test_parse_demo_cast_output(self, demo_cast_events: list[Event]) -> None:
         """Test demo.cast output events contain expected content."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert
         output_data = " ".join(e.data for e in events)
@@ -104,26 +78,18 @@ class TestAsciinemaIntegration:
         # Based on demo.cast, expect the echo command
         assert "Hello Phillip" in output_data, "Should contain echo output"
 
-    def test_parse_demo_cast_timestamps_increase(self) -> None:
+    def test_parse_demo_cast_timestamps_increase(self, demo_cast_events: list[Event]) -> None:
         """Test demo.cast timestamps are monotonically increasing (or equal)."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert - timestamps should be >= 0 and reasonable
         for event in events:
             assert event.timestamp >= 0, "Timestamps should be non-negative"
             assert event.timestamp < 1000, "Timestamps should be reasonable (< 1000s)"
 
-    def test_parse_demo_cast_data_not_empty(self) -> None:
+    def test_parse_demo_cast_data_not_empty(self, demo_cast_events: list[Event]) -> None:
         """Test demo.cast events have non-empty data fields."""
-        # Arrange
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "demo.cast"
-
-        # Act
-        events = parse_cast_file(str(fixture_path))
+        events = demo_cast_events
 
         # Assert
         assert all(isinstance(e.data, str) for e in events), "All data should be strings"
@@ -0,0 +1,92 @@
+"""Integration tests for the SQLAlchemy repository."""
+
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
+from cli2ansible.domain.models import Event, Session, SessionStatus
+from sqlalchemy import inspect, text
+
+
+def test_file_sqlite_uses_wal_journal(tmp_path: Path) -> None:
+    """Test file-backed SQLite connections are tuned for batched writes."""
+    repo = SQLAlchemyRepository(f"sqlite:///{tmp_path / 'test.db'}")
+    repo.create_tables()
+
+    with repo.engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_unit_of_work_commits_once_on_exit() -> None:
+    """Test operations sharing a unit of work are persisted together."""
+    repo = SQLAlchemyRepository("sqlite:///:memory:")
+    repo.create_tables()
+    session = Session(name="uow")
+    event = Event(session_id=session.id, timestamp=0.0, event_type="o", data="ls")
+
+    with repo.unit_of_work() as db:
+        repo.create(session, db=db)
+        repo.save_events([event], db=db)
+        assert repo.get_events(session.id, db=db)[0].data == "ls"
+
+    assert repo.get(session.id) is not None
+    assert len(repo.get_events(session.id)) == 1
+
+
+def test_unit_of_work_rolls_back_on_error() -> None:
+    """Test nothing from a failed unit of work is persisted."""
+    repo = SQLAlchemyRepository("sqlite:///:memory:")
+    repo.create_tables()
+    session = Session(name="uow")
+
+    def create_then_fail() -> None:
+        with repo.unit_of_work() as db:
+            repo.create(session, db=db)
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        create_then_fail()
+
+    assert repo.get(session.id) is None
+
+
+def test_child_tables_have_session_ordering_indexes() -> None:
+    """Test events and commands are indexed by session plus their sort column."""
+    repo = SQLAlchemyRepository("sqlite:///:memory:")
+    repo.create_tables()
+    inspector = inspect(repo.engine)
+
+    def index_columns(table: str) -> list[list[str | None]]:
+        return [ix["column_names"] for ix in inspector.get_indexes(table)]
+
+    assert ["session_id", "sequence"] in index_columns("events")
+    assert ["session_id", "timestamp"] in index_columns("commands")
+
+
+def test_session_metadata_round_trips_through_json_column(tmp_path: Path) -> None:
+    """Test nested session metadata is stored and loaded intact."""
+    repo = SQLAlchemyRepository(f"sqlite:///{tmp_path / 'test.db'}")
+    repo.create_tables()
+    metadata = {"host": "web-1", "tags": ["a", "b"], "env": {"TERM": "xterm", "n": 2}}
+
+    session = repo.create(Session(name="meta", metadata=metadata))
+
+    loaded = repo.get(session.id)
+    assert loaded is not None
+    assert loaded.metadata == metadata
+
+
+def test_update_status_reports_missing_session() -> None:
+    """Test status updates change existing rows and report missing ones."""
+    repo = SQLAlchemyRepository("sqlite:///:memory:")
+    repo.create_tables()
+    session = repo.create(Session(name="status"))
+
+    assert repo.update_status(session.id, SessionStatus.UPLOADED) is True
+    assert repo.update_status(uuid4(), SessionStatus.UPLOADED) is False
+
+    loaded = repo.get(session.id)
+    assert loaded is not None
+    assert loaded.status == SessionStatus.UPLOADED
@@ -0,0 +1,28 @@
+"""Unit tests for the Alembic environment script."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_alembic_env_reads_database_url_from_settings() -> None:
+    """Test alembic/env.py loads the database URL through get_settings()."""
+    # Arrange
+    env = {**os.environ, "DATABASE_URL": "sqlite://"}
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head", "--sql"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    assert "SQLiteImpl" in result.stderr
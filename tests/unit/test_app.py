@@ -0,0 +1,39 @@
+"""Unit tests for the application composition root."""
+
+import subprocess
+import sys
+
+import pytest
+from cli2ansible import app as app_module
+from cli2ansible.settings import get_settings
+
+
+def test_import_does_not_build_services() -> None:
+    """Test importing the composition root does not load the DB or S3 clients."""
+    # Arrange
+    code = (
+        "import cli2ansible.app, sys; "
+        "assert 'boto3' not in sys.modules and 'sqlalchemy' not in sys.modules"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+
+
+def test_get_repository_returns_singleton(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the repository is created once and then reused."""
+    # Arrange
+    monkeypatch.setattr(get_settings(), "database_url", "sqlite:///:memory:")
+    monkeypatch.setattr(app_module, "_repository", None)
+
+    # Act
+    first = app_module.get_repository()
+    second = app_module.get_repository()
+
+    # Assert
+    assert first is second
@@ -3,7 +3,10 @@
 from uuid import UUID
 
 import pytest
-from cli2ansible.adapters.outbound.capture.asciinema_parser import AsciinemaParser
+from cli2ansible.adapters.outbound.capture.asciinema_parser import (
+    AsciinemaParser,
+    extract_command_from_osc,
+)
 from cli2ansible.domain.models import Event
 
 
@@ -323,3 +326,50 @@ class TestAsciinemaParser:
         assert len(events) == 2
         assert events[0].timestamp == 0.0  # 10.0 - 10.0
         assert events[1].timestamp == 10.0  # 20.0 - 10.0
+
+    def test_parse_events_stream_matches_parse_events(self) -> None:
+        """Test that streaming newline-terminated lines yields the same events."""
+        # Arrange
+        parser = AsciinemaParser()
+        lines = [
+            b'\n',
+            b'{"version":3}\n',
+            b'[0.5,"i","\\r"]\n',
+            b'[1.0,"o","\\u001b]2;pwd\\u0007"]\n',
+            b'[1.5,"i","\\r"]\n',
+            b'[2.0,"o","\\u001b]2;ls\\u0007"]\n',
+        ]
+
+        # Act
+        streamed = parser.parse_events_stream(iter(lines))
+        buffered = parser.parse_events(b"".join(lines))
+
+        # Assert
+        assert [(e.data, e.timestamp, e.sequence) for e in streamed] == [
+            (e.data, e.timestamp, e.sequence) for e in buffered
+        ]
+        assert [e.data for e in streamed] == ["pwd", "ls"]
+
+    def test_extract_command_from_osc_skips_empty_titles(self) -> None:
+        """Test OSC extraction ignores empty and unterminated title sequences."""
+        # Act / Assert
+        assert extract_command_from_osc("\x1b]2;\x07out\x1b]2;ls -la\x07") == "ls -la"
+        assert extract_command_from_osc("\x1b]2;unterminated") is None
+        assert extract_command_from_osc("plain output") is None
+
+    def test_parse_uses_supplied_session_id(self) -> None:
+        """Test that a caller-supplied session ID is assigned to every event."""
+        # Arrange
+        parser = AsciinemaParser()
+        session_id = UUID("12345678-1234-5678-1234-567812345678")
+        cast_data = (
+            b'{"version":3}\n'
+            b'[0.5,"i","\\r"]\n'
+            b'[1.0,"o","\\u001b]2;pwd\\u0007"]\n'
+        )
+
+        # Act
+        events = parser.parse_events(cast_data, session_id=session_id)
+
+        # Assert
+        assert [e.session_id for e in events] == [session_id]
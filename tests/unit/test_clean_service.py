@@ -188,3 +188,51 @@ def test_get_essential_commands_filters_duplicates(
     assert len(essential) == 2  # Should exclude the duplicate
     assert "apt-get install nginx" in essential
     assert "systemctl start nginx" in essential
+
+
+def test_clean_commands_reuses_result_until_commands_change(
+    clean_service: CleanSession, mock_repo: Mock, mock_llm: Mock
+) -> None:
+    """Test repeat cleaning of unchanged commands skips the LLM call."""
+    session_id = uuid4()
+
+    # Arrange
+    command = Command(
+        session_id=session_id, raw="echo test", normalized="echo test", timestamp=1.0
+    )
+    mock_repo.get_commands.return_value = [command]
+    cleaned = CleanedCommand(
+        session_id=session_id,
+        command="echo test",
+        reason="Print a message",
+        first_occurrence=1.0,
+    )
+    report = CleaningReport(
+        session_id=session_id,
+        original_command_count=1,
+        cleaned_command_count=1,
+        duplicates_removed=0,
+        error_corrections_removed=0,
+        cleaning_rationale="Nothing to remove",
+    )
+    mock_llm.clean_commands.return_value = ([cleaned], report)
+
+    # Act
+    first = clean_service.clean_commands(session_id)
+    first[0][0].command = "mutated by caller"
+    second = clean_service.clean_commands(session_id)
+    clean_service.get_essential_commands(session_id)
+
+    # Assert
+    assert mock_llm.clean_commands.call_count == 1
+    assert second[0][0].command == "echo test"
+    assert second[0][0] is not cleaned
+    assert second[1].cleaning_rationale == report.cleaning_rationale
+    assert second[1] is not report
+
+    # Act: commands change
+    mock_repo.get_commands.return_value = [command, command]
+    clean_service.clean_commands(session_id)
+
+    # Assert
+    assert mock_llm.clean_commands.call_count == 2
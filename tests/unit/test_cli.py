@@ -168,6 +168,26 @@ class TestConvertCastToJson:
         finally:
             Path(temp_path).unlink()
 
+    def test_convert_cast_to_json_no_events(self) -> None:
+        """Test a cast without commands produces an empty JSON array."""
+        # Arrange
+        cast_content = '{"version":3,"timestamp":1234567890}\n[0.0,"o","$ "]\n'
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cast", delete=False) as f:
+            f.write(cast_content)
+            temp_path = f.name
+
+        try:
+            # Act
+            captured_output = StringIO()
+            with patch("sys.stdout", captured_output):
+                convert_cast_to_json(temp_path)
+
+            # Assert
+            assert captured_output.getvalue() == "[]\n"
+        finally:
+            Path(temp_path).unlink()
+
 
 class TestCLIMain:
     """Test suite for CLI main function."""
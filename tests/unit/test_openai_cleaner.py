@@ -1,6 +1,7 @@
 """Unit tests for OpenAICleaner adapter."""
 
 import json
+from collections.abc import Iterator
 from unittest.mock import Mock, patch
 from uuid import uuid4
 
@@ -9,6 +10,13 @@ from cli2ansible.adapters.outbound.llm.openai_cleaner import OpenAICleaner
 from cli2ansible.domain.models import Command
 
 
+@pytest.fixture(autouse=True)
+def no_retry_sleep() -> Iterator[Mock]:
+    """Skip real backoff sleeps between retried API calls."""
+    with patch("cli2ansible.adapters.outbound.llm.openai_cleaner.time.sleep") as sleep:
+        yield sleep
+
+
 @pytest.fixture()
 def cleaner() -> OpenAICleaner:
     """Create OpenAICleaner instance."""
@@ -394,3 +402,204 @@ def test_client_timeout_configuration(
 
     # Assert: Verify client created with timeout
     mock_client_class.assert_called_once_with(timeout=60.0)
+
+
+@patch("cli2ansible.adapters.outbound.llm.openai_cleaner.httpx.Client")
+def test_client_reused_across_calls(
+    mock_client_class: Mock, cleaner: OpenAICleaner, sample_commands: list[Command]
+) -> None:
+    """Test that one pooled HTTP client serves repeated calls until closed."""
+    session_id = sample_commands[0].session_id
+
+    # Arrange
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {
+                            "essential_commands": [],
+                            "removed_commands": [],
+                            "rationale": "",
+                        }
+                    )
+                }
+            }
+        ]
+    }
+    mock_client = Mock()
+    mock_client.post.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    # Act
+    cleaner.clean_commands(sample_commands, session_id)
+    cleaner.clean_commands(sample_commands[:2], session_id)
+    cleaner.close()
+
+    # Assert
+    mock_client_class.assert_called_once_with(timeout=60.0)
+    assert mock_client.post.call_count == 2
+    mock_client.close.assert_called_once()
+
+
+@patch("cli2ansible.adapters.outbound.llm.openai_cleaner.httpx.Client")
+def test_api_retries_rate_limit_then_succeeds(
+    mock_client_class: Mock,
+    no_retry_sleep: Mock,
+    cleaner: OpenAICleaner,
+    sample_commands: list[Command],
+) -> None:
+    """Test that a 429 is retried, honoring Retry-After."""
+    session_id = sample_commands[0].session_id
+
+    # Arrange: first call rate limited, second succeeds
+    import httpx
+
+    limited = Mock()
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "2"}
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {
+                            "essential_commands": [],
+                            "removed_commands": [],
+                            "rationale": "ok",
+                        }
+                    )
+                }
+            }
+        ]
+    }
+    mock_client = Mock()
+    mock_client.post.side_effect = [
+        httpx.HTTPStatusError("Too Many Requests", request=Mock(), response=limited),
+        mock_response,
+    ]
+    mock_client_class.return_value = mock_client
+
+    # Act
+    _, report = cleaner.clean_commands(sample_commands, session_id)
+
+    # Assert
+    assert report.cleaning_rationale == "ok"
+    assert mock_client.post.call_count == 2
+    no_retry_sleep.assert_called_once_with(2.0)
+
+
+@patch("cli2ansible.adapters.outbound.llm.openai_cleaner.httpx.Client")
+def test_api_gives_up_after_max_retries(
+    mock_client_class: Mock, no_retry_sleep: Mock, sample_commands: list[Command]
+) -> None:
+    """Test that persistent server errors fail after max_retries attempts."""
+    session_id = sample_commands[0].session_id
+    cleaner = OpenAICleaner(api_key="test-key-123", max_retries=2)
+
+    # Arrange
+    import httpx
+
+    unavailable = Mock()
+    unavailable.status_code = 503
+    unavailable.headers = {}
+    mock_client = Mock()
+    mock_client.post.side_effect = httpx.HTTPStatusError(
+        "Service Unavailable", request=Mock(), response=unavailable
+    )
+    mock_client_class.return_value = mock_client
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="failed with status 503"):
+        cleaner.clean_commands(sample_commands, session_id)
+    assert mock_client.post.call_count == 3
+    assert no_retry_sleep.call_count == 2
+
+
+@patch("cli2ansible.adapters.outbound.llm.openai_cleaner.httpx.Client")
+def test_identical_prompt_served_from_cache(
+    mock_client_class: Mock, cleaner: OpenAICleaner, sample_commands: list[Command]
+) -> None:
+    """Test that cleaning the same commands again does not call the API."""
+    # Arrange
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {
+                            "essential_commands": [
+                                {
+                                    "command": "systemctl start nginx",
+                                    "reason": "Start service",
+                                    "first_occurrence_index": 2,
+                                }
+                            ],
+                            "removed_commands": [],
+                            "rationale": "cached",
+                        }
+                    )
+                }
+            }
+        ]
+    }
+    mock_client = Mock()
+    mock_client.post.return_value = mock_response
+    mock_client_class.return_value = mock_client
+    other_session = uuid4()
+
+    # Act
+    first, _ = cleaner.clean_commands(sample_commands, sample_commands[0].session_id)
+    second, report = cleaner.clean_commands(sample_commands, other_session)
+
+    # Assert
+    mock_client.post.assert_called_once()
+    assert [c.command for c in second] == [c.command for c in first]
+    assert second[0].session_id == other_session
+    assert report.session_id == other_session
+
+
+@patch("cli2ansible.adapters.outbound.llm.openai_cleaner.httpx.Client")
+def test_parse_response_out_of_range_index_falls_back_to_text(
+    mock_client_class: Mock, cleaner: OpenAICleaner, sample_commands: list[Command]
+) -> None:
+    """Test an essential command with a bad index is matched by its text."""
+    session_id = sample_commands[0].session_id
+
+    # Arrange
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [
+            {
+                "message": {
+                    "content": json.dumps(
+                        {
+                            "essential_commands": [
+                                {
+                                    "command": "systemctl start nginx",
+                                    "reason": "Start service",
+                                    "first_occurrence_index": 99,
+                                }
+                            ],
+                            "removed_commands": [],
+                            "rationale": "Test",
+                        }
+                    )
+                }
+            }
+        ]
+    }
+    mock_client = Mock()
+    mock_client.post.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    # Act
+    cleaned_commands, report = cleaner.clean_commands(sample_commands, session_id)
+
+    # Assert
+    assert len(cleaned_commands) == 1
+    assert cleaned_commands[0].first_occurrence == 3.0
+    assert report.cleaned_command_count == 1
@@ -0,0 +1,68 @@
+"""Unit tests for the LLM rate limiter."""
+
+from cli2ansible.adapters.outbound.llm.rate_limiter import (
+    RateLimiter,
+    RateLimitProfile,
+)
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep just moves time forward."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_acquire_waits_when_request_window_is_full() -> None:
+    """Test that exceeding requests-per-minute blocks until the window slides."""
+    # Arrange
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitProfile(rpm=2, tpm=1_000, max_concurrent=5),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    # Act
+    for _ in range(3):
+        limiter.release(limiter.acquire(estimated_tokens=10))
+        clock.now += 1.0
+
+    # Assert
+    assert clock.sleeps == [58.0]
+
+
+def test_release_corrects_token_estimate() -> None:
+    """Test that actual token usage replaces the estimate in the window."""
+    # Arrange
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitProfile(rpm=10, tpm=100, max_concurrent=5),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    # Act: estimate is small, but the response reports the budget was used up
+    limiter.release(limiter.acquire(estimated_tokens=10), actual_tokens=100)
+    clock.now += 5.0
+    limiter.release(limiter.acquire(estimated_tokens=10))
+
+    # Assert
+    assert clock.sleeps == [55.0]
+
+
+def test_for_provider_uses_known_profile() -> None:
+    """Test that provider profiles are pre-seeded."""
+    limiter = RateLimiter.for_provider("openai")
+
+    assert limiter.profile.rpm == 60
+    assert limiter.profile.tpm == 150_000
+    assert limiter.profile.max_concurrent == 10
@@ -0,0 +1,55 @@
+"""Unit tests for the S3 object store adapter."""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+from cli2ansible.adapters.outbound.object_store import s3_store
+from cli2ansible.adapters.outbound.object_store.s3_store import S3ObjectStore
+
+
+@pytest.fixture()
+def s3_client(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace boto3.client with a mock S3 client."""
+    client = Mock()
+    monkeypatch.setattr(s3_store.boto3, "client", Mock(return_value=client))
+    return client
+
+
+@pytest.fixture()
+def store(s3_client: Mock) -> S3ObjectStore:
+    """Create an S3 store backed by the mock client."""
+    return S3ObjectStore("http://s3.test", "key", "secret", "bucket")
+
+
+def test_upload_small_file_object_uses_put_object(
+    store: S3ObjectStore, s3_client: Mock
+) -> None:
+    """Test a small seekable file object is sent with a single PUT."""
+    # Arrange
+    data = io.BytesIO(b"---\n- hosts: all\n")
+
+    # Act
+    store.upload("role.yml", data, "text/yaml")
+
+    # Assert
+    s3_client.put_object.assert_called_once_with(
+        Bucket="bucket", Key="role.yml", Body=data, ContentType="text/yaml"
+    )
+    s3_client.upload_fileobj.assert_not_called()
+    assert data.tell() == 0
+
+
+def test_upload_large_file_object_uses_multipart(
+    store: S3ObjectStore, s3_client: Mock
+) -> None:
+    """Test a file object at the multipart threshold goes through upload_fileobj."""
+    # Arrange
+    data = io.BytesIO(b"\0" * s3_store._MULTIPART_THRESHOLD)
+
+    # Act
+    store.upload("role.tar.gz", data)
+
+    # Assert
+    s3_client.put_object.assert_not_called()
+    s3_client.upload_fileobj.assert_called_once()
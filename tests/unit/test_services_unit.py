@@ -1,9 +1,13 @@
 """Unit tests for domain services."""
 
+from unittest.mock import Mock
+
 import pytest
 from cli2ansible.adapters.outbound.db.repository import SQLAlchemyRepository
-from cli2ansible.domain.models import Event
-from cli2ansible.domain.services import IngestSession
+from cli2ansible.adapters.outbound.translator.rules_engine import RulesEngine
+from cli2ansible.domain.models import Command, Event, SessionStatus
+from cli2ansible.domain.ports import ObjectStorePort, RoleGeneratorPort
+from cli2ansible.domain.services import CompilePlaybook, IngestSession
 
 
 @pytest.fixture()
@@ -20,6 +24,13 @@ def ingest_service(repo):
     return IngestSession(repo)
 
 
+def test_create_session_uses_one_timestamp(ingest_service):
+    """Test that a new session's created_at and updated_at are identical."""
+    session = ingest_service.create_session("test-session")
+
+    assert session.created_at == session.updated_at
+
+
 def test_extract_commands_with_newlines(ingest_service, repo):
     """Test extract_commands with events that contain newlines."""
     # Create session
@@ -122,3 +133,79 @@ def test_extract_commands_without_newlines(ingest_service, repo):
     assert "cd test_1" in command_texts
     assert 'echo "Hello Phillip"' in command_texts
     assert "exit" in command_texts
+
+
+def test_extract_commands_replaces_earlier_extraction(ingest_service, repo):
+    """Test extracting twice does not store the session's commands twice."""
+    session = ingest_service.create_session("test-session")
+    ingest_service.save_events(
+        session.id,
+        [
+            Event(
+                session_id=session.id,
+                timestamp=0.001,
+                event_type="o",
+                data="mkdir test_1\n",
+                sequence=0
+            )
+        ],
+    )
+
+    ingest_service.extract_commands(session.id)
+    ingest_service.extract_commands(session.id)
+
+    assert [cmd.raw for cmd in repo.get_commands(session.id)] == ["mkdir test_1"]
+
+
+def test_compile_reuses_cached_result_until_commands_change(ingest_service, repo):
+    """Test compile only re-translates when the session's name or commands change."""
+    session = ingest_service.create_session("test-session")
+    repo.save_commands(
+        [
+            Command(
+                session_id=session.id,
+                raw="apt-get install nginx",
+                normalized="apt-get install nginx",
+                timestamp=1.0,
+            )
+        ]
+    )
+    translator = Mock(wraps=RulesEngine())
+    compile_service = CompilePlaybook(
+        repo, translator, Mock(spec=RoleGeneratorPort), Mock(spec=ObjectStorePort)
+    )
+
+    role, report = compile_service.compile(session.id)
+    role.tasks.clear()
+    report.skipped_commands.append("mutated by caller")
+    repo.update_status(session.id, SessionStatus.UPLOADED)
+    cached_role, cached_report = compile_service.compile(session.id)
+
+    assert translator.translate_many.call_count == 1
+    assert cached_role is not role
+    assert [task.name for task in cached_role.tasks] == ["Install packages: nginx"]
+    assert cached_report.skipped_commands == []
+    assert cached_report.generated_at == report.generated_at
+    assert repo.get(session.id).status == SessionStatus.COMPLETED
+
+    session.name = "renamed-session"
+    repo.update(session)
+    renamed_role, _ = compile_service.compile(session.id)
+
+    assert translator.translate_many.call_count == 2
+    assert renamed_role.name == "renamed-session"
+
+    repo.save_commands(
+        [
+            Command(
+                session_id=session.id,
+                raw="systemctl start nginx",
+                normalized="systemctl start nginx",
+                timestamp=2.0,
+            )
+        ]
+    )
+    _, new_report = compile_service.compile(session.id)
+
+    assert translator.translate_many.call_count == 3
+    assert new_report.total_commands == 2
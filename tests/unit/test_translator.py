@@ -92,3 +92,21 @@ def test_unknown_command_fallback(translator: RulesEngine) -> None:
     assert task.module == "shell"
     assert task.args["cmd"] == "some-unknown-command --flag"
     assert task.confidence == TaskConfidence.LOW
+
+
+def test_translate_many_preserves_order(translator: RulesEngine) -> None:
+    """Test batch translation returns one result per command, in order."""
+    session_id = uuid4()
+    commands = [
+        Command(session_id=session_id, raw=raw, normalized=raw)
+        for raw in ["mkdir -p /opt/app", "   ", "some-unknown-command"]
+    ]
+
+    tasks = translator.translate_many(commands)
+
+    assert len(tasks) == 3
+    assert tasks[0] is not None
+    assert tasks[0].module == "file"
+    assert tasks[1] is None
+    assert tasks[2] is not None
+    assert tasks[2].module == "shell"